@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Quantum Maze Generation Benchmark
+Times every phase of Maze.generate_maze (Maze.generation_phases) across
+sizes, algorithms and seeds
+
+Runs headless. Each case is generated twice: once for wall-clock timing
+and once under tracemalloc for peak memory (tracing slows Python code
+down, so the two are kept apart). Results are written as JSON so runs on
+different commits can be compared with --compare.
+    
+    python benchmark_maze.py
+    python benchmark_maze.py --sizes 40x30 200x150 --algorithms sidewinder --output new.json
+    python benchmark_maze.py --compare old.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import numpy as np
+from maze import Maze
+from maze_generation import ALGORITHMS
+
+DEFAULT_SIZES = ['40x30', '200x150', '1000x1000']
+DEFAULT_SEEDS = [1, 2, 3]
+
+def run_case(width: int, height: int, algorithm: str, seed: int) -> dict:
+    """Time and measure every generation phase of one maze"""
+    cells = width * height
+    phases = {}
+    
+    # Wall-clock pass
+    maze = Maze(width, height, algorithm=algorithm, seed=seed, generate=False)
+    for name, phase in maze.generation_phases():
+        start = time.perf_counter()
+        phase()
+        seconds = time.perf_counter() - start
+        phases[name] = {
+            'seconds': seconds,
+            'cells_per_second': cells / seconds if seconds > 0 else None,
+        }
+    
+    # Peak memory pass (same seed, so the same work)
+    maze = Maze(width, height, algorithm=algorithm, seed=seed, generate=False)
+    tracemalloc.start()
+    for name, phase in maze.generation_phases():
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        phase()
+        phases[name]['peak_bytes'] = tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    
+    total = sum(phase['seconds'] for phase in phases.values())
+    return {
+        'width': width,
+        'height': height,
+        'algorithm': algorithm,
+        'seed': seed,
+        'seconds': total,
+        'cells_per_second': cells / total if total > 0 else None,
+        'peak_bytes': max(phase['peak_bytes'] for phase in phases.values()),
+        'path_cells': maze.get_path_cell_count(),
+        'superposition_walls': len(maze.wall_field),
+        'phases': phases,
+    }
+
+def git_commit() -> str:
+    """Commit being benchmarked, if this is a git checkout"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+def case_key(result: dict) -> tuple:
+    return result['width'], result['height'], result['algorithm'], result['seed']
+
+def compare(results: list, baseline_path: str):
+    """Print per-phase timing ratios against an earlier benchmark file"""
+    with open(baseline_path) as f:
+        baseline = {case_key(result): result for result in json.load(f)['results']}
+    
+    print(f"\nCompared with {baseline_path} (new / old time, >1 is slower):")
+    for result in results:
+        old = baseline.get(case_key(result))
+        if old is None:
+            continue
+        ratios = []
+        for name, phase in result['phases'].items():
+            old_phase = old['phases'].get(name)
+            if old_phase and old_phase['seconds'] > 0:
+                ratios.append(f"{name} {phase['seconds'] / old_phase['seconds']:.2f}x")
+        print(f"  {result['width']}x{result['height']} {result['algorithm']} seed {result['seed']}: "
+              f"total {result['seconds'] / old['seconds']:.2f}x ({', '.join(ratios)})")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark quantum maze generation")
+    parser.add_argument('--sizes', nargs='+', default=DEFAULT_SIZES, help="WIDTHxHEIGHT, e.g. 200x150")
+    parser.add_argument('--algorithms', nargs='+', default=list(ALGORITHMS), choices=list(ALGORITHMS))
+    parser.add_argument('--seeds', nargs='+', type=int, default=DEFAULT_SEEDS)
+    parser.add_argument('--output', default='maze_benchmark.json', help="JSON results file")
+    parser.add_argument('--compare', help="Earlier results file to compare against")
+    args = parser.parse_args()
+    
+    results = []
+    for size in args.sizes:
+        width, height = (int(value) for value in size.lower().split('x'))
+        for algorithm in args.algorithms:
+            for seed in args.seeds:
+                result = run_case(width, height, algorithm, seed)
+                results.append(result)
+                print(f"{width}x{height} {algorithm:<12} seed {seed}: "
+                      f"{result['seconds'] * 1000:9.1f} ms  "
+                      f"{result['cells_per_second'] / 1e6:6.2f} Mcells/s  "
+                      f"peak {result['peak_bytes'] / 1024 / 1024:7.1f} MiB")
+    
+    report = {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+    
+    if args.compare:
+        compare(results, args.compare)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+import pygame
+from typing import Optional, Tuple
+
+class Camera:
+    """Viewport onto the maze world that follows the player
+    
+    Stores the world position of the view's top-left corner. Everything
+    drawn in world space goes through world_to_screen, and layers use
+    is_visible / get_visible_cells to skip what's off screen.
+    """
+    def __init__(self, view_width: int, view_height: int, world_width: int, world_height: int):
+        self.view_width = view_width
+        self.view_height = view_height
+        self.world_width = world_width
+        self.world_height = world_height
+        self.x = 0
+        self.y = 0
+    
+    def set_world_size(self, world_width: int, world_height: int):
+        """Resize the world (e.g. after a new maze is generated)"""
+        self.world_width = world_width
+        self.world_height = world_height
+        self._clamp()
+    
+    def follow(self, target_x: float, target_y: float):
+        """Centre the view on a world position, clamped to the world edges"""
+        self.x = int(target_x) - self.view_width // 2
+        self.y = int(target_y) - self.view_height // 2
+        self._clamp()
+    
+    def _clamp(self):
+        """Keep the view inside the world (worlds smaller than the view stay at 0)"""
+        self.x = max(0, min(self.x, self.world_width - self.view_width))
+        self.y = max(0, min(self.y, self.world_height - self.view_height))
+    
+    @property
+    def offset(self) -> Tuple[int, int]:
+        """World position of the top-left corner of the view"""
+        return self.x, self.y
+    
+    def world_to_screen(self, x: float, y: float) -> Tuple[float, float]:
+        """Convert world coordinates to screen coordinates"""
+        return x - self.x, y - self.y
+    
+    def screen_to_world(self, x: float, y: float) -> Tuple[float, float]:
+        """Convert screen coordinates to world coordinates"""
+        return x + self.x, y + self.y
+    
+    def get_view_rect(self) -> pygame.Rect:
+        """Visible area in world coordinates"""
+        return pygame.Rect(self.x, self.y, self.view_width, self.view_height)
+    
+    def is_visible(self, x: float, y: float, margin: float = 0) -> bool:
+        """Check if a world position (plus a margin for effects) is in view"""
+        return (self.x - margin <= x < self.x + self.view_width + margin and
+                self.y - margin <= y < self.y + self.view_height + margin)
+    
+    def get_visible_cells(self, cell_size: int, grid_width: int, grid_height: int) -> Tuple[int, int, int, int]:
+        """Range of grid cells in view as (x0, y0, x1, y1), end exclusive"""
+        x0 = max(0, self.x // cell_size)
+        y0 = max(0, self.y // cell_size)
+        x1 = min(grid_width, (self.x + self.view_width) // cell_size + 1)
+        y1 = min(grid_height, (self.y + self.view_height) // cell_size + 1)
+        return x0, y0, x1, y1
+
+def to_screen(camera: Optional[Camera], x: float, y: float) -> Tuple[float, float]:
+    """World to screen coordinates, or unchanged when drawing without a camera"""
+    if camera is None:
+        return x, y
+    return camera.world_to_screen(x, y)
+
+def in_view(camera: Optional[Camera], x: float, y: float, margin: float = 0) -> bool:
+    """Visibility test that treats everything as visible without a camera"""
+    return camera is None or camera.is_visible(x, y, margin)
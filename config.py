@@ -6,12 +6,18 @@ Easy customization of game parameters
 # === DISPLAY SETTINGS ===
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
+MAX_SCREEN_WIDTH = 1280   # Larger mazes scroll inside a window of at most this size
+MAX_SCREEN_HEIGHT = 720
 FPS = 60
 
 # === MAZE SETTINGS ===
 MAZE_WIDTH = 40          # Number of cells horizontally
 MAZE_HEIGHT = 30         # Number of cells vertically  
 CELL_SIZE = 20           # Size of each maze cell in pixels
+MAZE_ALGORITHM = 'backtracker'  # 'backtracker', 'eller', 'wilson', 'binary_tree' or 'sidewinder'
+MAZE_SEED = None         # Base seed for reproducible levels (level N uses MAZE_SEED + N - 1)
+MAZE_CACHE_DIR = '.maze_cache'  # Where seeded levels are saved after generation
+DISTANCE_FIELD_CACHE_MB = 64     # Memory for cached path distance maps per maze
 
 # Superposition wall settings
 SUPERPOSITION_WALL_CHANCE = 0.15  # 15% chance for walls to become superposition walls
@@ -28,6 +34,9 @@ ENTANGLEMENT_DURATION = 10.0
 # === ENEMY SETTINGS ===
 GHOST_SPEED = 1.5        # Base ghost movement speed
 GHOST_RADIUS = 10        # Ghost collision radius
+GHOST_PLANNER = 'astar'  # 'astar', or 'incremental' to repair scatter paths (D* Lite) as walls flip
+AI_BUDGET_MS = 2.0       # Ghost path planning time per frame, spread over frames when exceeded
+CHASE_FIELD_RADIUS = 48  # Cells of path around the player the chasers' shared field covers (A* beyond)
 
 # Ghost behavior timings (in seconds)
 CHASE_SCATTER_INTERVAL = 10.0    # How often ghosts switch between chase/scatter
@@ -134,14 +143,16 @@ def set_difficulty(difficulty: str):
         POWERUP_SPAWN_INTERVAL = 25.0
         ENTANGLEMENT_TIME_LIMIT = 5.0
 
-def set_maze_size(width: int, height: int):
-    """Set custom maze dimensions"""
-    global MAZE_WIDTH, MAZE_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT
+def set_maze_size(width: int, height: int, algorithm: str = None):
+    """Set custom maze dimensions (and optionally the generation algorithm)"""
+    global MAZE_WIDTH, MAZE_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT, MAZE_ALGORITHM
     
+    if algorithm is not None:
+        MAZE_ALGORITHM = algorithm
     MAZE_WIDTH = width
     MAZE_HEIGHT = height
-    SCREEN_WIDTH = width * CELL_SIZE
-    SCREEN_HEIGHT = height * CELL_SIZE
+    SCREEN_WIDTH = min(width * CELL_SIZE, MAX_SCREEN_WIDTH)
+    SCREEN_HEIGHT = min(height * CELL_SIZE, MAX_SCREEN_HEIGHT)
 
 def enable_debug_mode():
     """Enable debug features"""
@@ -181,6 +192,7 @@ set_difficulty('HARD')
 
 # Custom maze size  
 set_maze_size(50, 40)  # Larger maze
+set_maze_size(2001, 2001, 'sidewinder')  # Huge arena, vectorized generator
 
 # Adjust specific settings
 PLAYER_SPEED = 4.0     # Faster player
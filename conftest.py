@@ -0,0 +1,9 @@
+"""
+pytest configuration
+
+test_quantum_notation.py is an interactive pygame demo that runs its
+game loop at import time, so it is kept out of test collection. Run it
+directly with python instead.
+"""
+
+collect_ignore = ['test_quantum_notation.py']
@@ -0,0 +1,99 @@
+"""
+BFS distance fields over the maze
+
+A distance field holds the path distance (in cells) from one source cell
+to every cell of the maze, or -1 where the source can't reach. Fields are
+computed over the static topology (superposition walls count as open) so
+they stay valid for the whole level, and the popular ones (player cell,
+patrol centres, qubits) are kept in a memory-capped LRU so every caller
+asking about the same source shares one BFS. Callers that only care about
+the neighbourhood of a source ask for a field cut off at a maximum
+distance, which costs a search of that radius instead of the whole maze.
+"""
+
+import numpy as np
+from collections import OrderedDict
+from typing import Optional
+
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+def bfs_distances(passable: np.ndarray, x: int, y: int, max_distance: Optional[int] = None) -> np.ndarray:
+    """Path distance from (x, y) to every cell of a passable mask
+    
+    Expands the whole frontier per step with array ops, so the cost is
+    one vectorized pass per distance ring rather than per cell. With
+    max_distance the search stops that many steps out (cells further away
+    are -1 too) and only the square of cells that close is searched.
+    """
+    height, width = passable.shape
+    if max_distance is not None:
+        # A path of n steps can't leave the square n cells around its start
+        left, top = max(0, x - max_distance), max(0, y - max_distance)
+        window = passable[top:y + max_distance + 1, left:x + max_distance + 1]
+        distances = np.full((height, width), -1, dtype=np.int32)
+        distances[top:top + window.shape[0], left:left + window.shape[1]] = _bfs(
+            window, x - left, y - top, max_distance)
+        return distances
+    return _bfs(passable, x, y, height * width)
+
+def _bfs(passable: np.ndarray, x: int, y: int, max_distance: int) -> np.ndarray:
+    height, width = passable.shape
+    stride = width + 2
+    
+    # A closed border means neighbour offsets never leave the array
+    open_cells = np.zeros((height + 2, stride), dtype=bool)
+    open_cells[1:-1, 1:-1] = passable
+    open_cells = open_cells.ravel()
+    distances = np.full(open_cells.size, -1, dtype=np.int32)
+    
+    source = (y + 1) * stride + x + 1
+    distances[source] = 0
+    open_cells[source] = False
+    offsets = np.array([-1, 1, -stride, stride])
+    frontier = np.array([source])
+    distance = 0
+    while frontier.size and distance < max_distance:
+        distance += 1
+        neighbours = (frontier[:, None] + offsets).ravel()
+        # Unique, or cells shared by two frontier cells multiply every ring
+        neighbours = np.unique(neighbours[open_cells[neighbours]])
+        open_cells[neighbours] = False
+        distances[neighbours] = distance
+        frontier = neighbours
+    
+    return np.ascontiguousarray(distances.reshape(height + 2, stride)[1:-1, 1:-1])
+
+class DistanceFieldCache:
+    """LRU of distance fields keyed by source cell and cut-off, capped by total bytes"""
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.fields: OrderedDict = OrderedDict()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+    
+    def lookup(self, x: int, y: int, max_distance: Optional[int] = None) -> Optional[np.ndarray]:
+        """Cached field for a source cell, or None"""
+        field = self.fields.get((x, y, max_distance))
+        if field is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.fields.move_to_end((x, y, max_distance))
+        return field
+    
+    def store(self, x: int, y: int, field: np.ndarray, max_distance: Optional[int] = None) -> np.ndarray:
+        """Cache a field (read-only, it is shared) and evict the oldest over the cap"""
+        field.setflags(write=False)
+        self.fields[(x, y, max_distance)] = field
+        self.size_bytes += field.nbytes
+        while self.size_bytes > self.max_bytes and len(self.fields) > 1:
+            _, evicted = self.fields.popitem(last=False)
+            self.size_bytes -= evicted.nbytes
+        return field
+    
+    def clear(self):
+        """Drop every field (the maze layout changed)"""
+        self.fields.clear()
+        self.size_bytes = 0
+
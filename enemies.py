@@ -1,9 +1,19 @@
 import pygame
 import math
 import random
-from typing import List, Tuple, Optional
+import numpy as np
+from typing import List, Set, Tuple, Optional
 from enum import Enum
-from maze import CellType
+from camera import to_screen, in_view
+from pathfinding import PathCache, IncrementalPlanner
+from ai_scheduler import AIScheduler
+from spatial_hash import SpatialHash
+import config
+
+GHOST_ALPHA_LEVELS = 16       # Quantized alpha steps for cached ghost sprites
+WANDERER_CLOUD_VARIANTS = 8   # Pre-baked particle cloud layouts per wanderer colour
+PATROL_RING_ALPHA_STEP = 8    # Guardian patrol rings are cached every 8 alpha (6 steps over 10-50)
+GLITCH_JITTER = [(random.randint(-2, 2), random.randint(-2, 2)) for _ in range(32)]
 
 class GhostState(Enum):
     CHASE = 1
@@ -15,13 +25,174 @@ class GhostType(Enum):
     WANDERER = 2    # Moves randomly
     GUARDIAN = 3    # Patrols areas with many qubits
 
+class GhostStore:
+    """Struct-of-arrays ghost state: every ghost ticks and moves in vectorized steps
+    
+    Ghosts keep their AI (targets, paths) as objects, but their positions,
+    path cursors, effect phases and replan timers live here, one slot each.
+    The per-ghost Python AI only runs for the slots deciding() picks.
+    """
+    FIELDS = (('x', np.float64), ('y', np.float64), ('speed', np.float64),
+              ('waypoint_x', np.float64), ('waypoint_y', np.float64), ('path_index', np.int32),
+              ('has_waypoint', bool), ('captured', bool), ('dirty', bool), ('replan_timer', np.float64),
+              ('glitch_phase', np.float64), ('instability_phase', np.float64), ('corruption', np.float64),
+              ('cell_x', np.int32), ('cell_y', np.int32))
+    
+    def __init__(self, capacity: int = 16):
+        self.count = 0
+        self.ghosts: List['DecoherenceGhost'] = []  # Slot -> ghost
+        self.index: Optional[SpatialHash] = None  # Kept up to date as ghosts move
+        for name, dtype in self.FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+    
+    def add(self, ghost: 'DecoherenceGhost') -> int:
+        """Give a ghost a slot, growing the arrays when full"""
+        if self.count == len(self.x):
+            for name, dtype in self.FIELDS:
+                grown = np.zeros(max(1, self.count * 2), dtype=dtype)
+                grown[:self.count] = getattr(self, name)
+                setattr(self, name, grown)
+        self.ghosts.append(ghost)
+        self.count += 1
+        return self.count - 1
+    
+    def clear(self):
+        """Drop every ghost (new level)"""
+        self.ghosts.clear()
+        self.count = 0
+        self.index = None
+    
+    def attach_index(self, index: SpatialHash):
+        """Index every ghost in a spatial hash and keep it updated from step()"""
+        self.index = index
+        n = self.count
+        self.cell_x[:n] = np.floor_divide(self.x[:n], index.cell_size)
+        self.cell_y[:n] = np.floor_divide(self.y[:n], index.cell_size)
+        for ghost in self.ghosts:
+            index.insert(ghost, ghost.x, ghost.y)
+    
+    def tick(self, dt: float):
+        """Advance the effect phases and replan timers of every active ghost"""
+        n = self.count
+        active = ~self.captured[:n]
+        self.glitch_phase[:n] += active * (dt * 8)
+        self.instability_phase[:n] += active * (dt * 5)
+        self.corruption[:n] = (np.sin(self.instability_phase[:n]) + 1) * 0.5
+        self.replan_timer[:n] -= active * dt
+    
+    def deciding(self) -> np.ndarray:
+        """Slots of the ghosts that need an AI decision: path used up or hit by
+        a wall flip, or replan timer run out"""
+        n = self.count
+        return np.flatnonzero(~self.captured[:n] &
+                              (~self.has_waypoint[:n] | self.dirty[:n] | (self.replan_timer[:n] <= 0)))
+    
+    def step(self, dt: float, maze):
+        """Move every ghost one tick along its path"""
+        n = self.count
+        if n == 0:
+            return
+        x, y = self.x[:n], self.y[:n]
+        move = self.speed[:n] * dt * 60
+        following = ~self.captured[:n] & self.has_waypoint[:n]
+        
+        # Head for the current path point, which counts as reached within 5 px
+        dx = self.waypoint_x[:n] - x
+        dy = self.waypoint_y[:n] - y
+        distance = np.hypot(dx, dy)
+        arrived = following & (distance < 5)
+        moving = following & ~arrived
+        scale = np.where(moving, move / np.where(moving, distance, 1.0), 0.0)
+        step_x = dx * scale
+        step_y = dy * scale
+        
+        # One batched wall probe for every ghost that moves
+        new_x, new_y = x + step_x, y + step_y
+        go = moving & ~maze.walls_at(new_x, new_y)
+        x[go] = new_x[go]
+        y[go] = new_y[go]
+        self.path_index[:n] += arrived
+        
+        # Re-bucket only the ghosts that crossed into another cell
+        if self.index is not None:
+            cell_x = np.floor_divide(x, self.index.cell_size).astype(np.int32)
+            cell_y = np.floor_divide(y, self.index.cell_size).astype(np.int32)
+            crossed = np.flatnonzero((cell_x != self.cell_x[:n]) | (cell_y != self.cell_y[:n]))
+            self.cell_x[:n], self.cell_y[:n] = cell_x, cell_y
+            for slot in crossed:
+                self.index.insert(self.ghosts[slot], x[slot], y[slot])
+        
+        # Only a few ghosts reach a path point per tick
+        for slot in np.flatnonzero(arrived):
+            self.ghosts[slot]._load_waypoint()
+
+class GhostSpriteCache:
+    """Ghost effect sprites built once and blitted every frame
+    
+    Sprites are keyed by (kind, colour, alpha bucket): glitch copies of the
+    body, chaser trail dots, guardian patrol rings and wanderer particle
+    clouds (where the bucket is the cloud variant, each with its particles'
+    alphas baked in).
+    """
+    RADII = {'glitch': config.GHOST_RADIUS, 'trail': 2}
+    
+    def __init__(self):
+        self.sprites = {}
+    
+    def get(self, kind: str, color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+        """A circle sprite of the given kind at the nearest cached alpha"""
+        bucket = round(alpha * (GHOST_ALPHA_LEVELS - 1) / 255)
+        sprite = self.sprites.get((kind, color, bucket))
+        if sprite is None:
+            radius = self.RADII[kind]
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*color, round(bucket * 255 / (GHOST_ALPHA_LEVELS - 1))),
+                               (radius, radius), radius)
+            self.sprites[(kind, color, bucket)] = sprite
+        return sprite
+    
+    def ring(self, color: Tuple[int, int, int], radius: int, alpha: int) -> pygame.Surface:
+        """A 2 px patrol ring outline at the nearest cached alpha step"""
+        bucket = round(alpha / PATROL_RING_ALPHA_STEP)
+        key = (('ring', radius), color, bucket)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*color, min(255, bucket * PATROL_RING_ALPHA_STEP)),
+                               (radius, radius), radius, 2)
+            self.sprites[key] = sprite
+        return sprite
+    
+    def cloud(self, color: Tuple[int, int, int], variant: int) -> pygame.Surface:
+        """One of the pre-baked wanderer particle clouds, centred on its sprite"""
+        sprite = self.sprites.get(('cloud', color, variant))
+        if sprite is None:
+            sprite = pygame.Surface((52, 52), pygame.SRCALPHA)
+            particle = pygame.Surface((3, 3), pygame.SRCALPHA)
+            for i in range(8):
+                particle_angle = random.random() * math.pi * 2
+                particle_distance = random.randint(15, 25)
+                particle.fill((0, 0, 0, 0))
+                pygame.draw.circle(particle, (*color, random.randint(50, 150)), (1, 1), 1)
+                sprite.blit(particle, (25 + math.cos(particle_angle) * particle_distance,
+                                       25 + math.sin(particle_angle) * particle_distance))
+            self.sprites[('cloud', color, variant)] = sprite
+        return sprite
+
 class DecoherenceGhost:
-    def __init__(self, x: int, y: int, ghost_id: int = 0, ghost_type: GhostType = GhostType.CHASER):
+    sprites = GhostSpriteCache()  # Shared by every ghost
+    
+    def __init__(self, x: int, y: int, ghost_id: int = 0, ghost_type: GhostType = GhostType.CHASER,
+                 store: Optional[GhostStore] = None):
+        # Kinematics live in a shared store (a private one when standalone)
+        self.store = store if store is not None else GhostStore(1)
+        self.slot = self.store.add(self)
+        
         self.x = float(x)
         self.y = float(y)
         self.ghost_id = ghost_id
         self.ghost_type = ghost_type
-        self.radius = 10
+        self.radius = config.GHOST_RADIUS
         self.speed = 1.5
         
         # AI state
@@ -34,8 +205,6 @@ class DecoherenceGhost:
         # Type-specific properties
         if ghost_type == GhostType.WANDERER:
             self.speed = 1.2  # Slightly slower
-            self.direction_change_timer = 0
-            self.direction_change_interval = 2.0  # Change direction every 2 seconds
         elif ghost_type == GhostType.GUARDIAN:
             self.speed = 1.0  # Slower but more persistent
             self.patrol_center = (x, y)
@@ -62,82 +231,190 @@ class DecoherenceGhost:
         self.path = []
         self.path_index = 0
         self.recalculate_path_timer = 0
+        self.flow_cell = None  # Cell the last flow field step was planned from
+        self.path_dirty = False  # A wall on the path flipped, re-plan now
+        
+        # Optional D* Lite planner that repairs the path to a fixed goal instead of re-planning
+        self.incremental = False
+        self.planner: Optional[IncrementalPlanner] = None
         
         # Entanglement
         self.entangled_with = None
         self.is_captured = False
         
-    def update(self, dt: float, maze, player, other_ghosts: List['DecoherenceGhost'], qubits=None):
-        """Update ghost AI and movement"""
+    # Store-backed attributes
+    @property
+    def x(self) -> float:
+        return float(self.store.x[self.slot])
+    
+    @x.setter
+    def x(self, value: float):
+        self.store.x[self.slot] = value
+    
+    @property
+    def y(self) -> float:
+        return float(self.store.y[self.slot])
+    
+    @y.setter
+    def y(self, value: float):
+        self.store.y[self.slot] = value
+    
+    @property
+    def speed(self) -> float:
+        return float(self.store.speed[self.slot])
+    
+    @speed.setter
+    def speed(self, value: float):
+        self.store.speed[self.slot] = value
+    
+    @property
+    def glitch_phase(self) -> float:
+        return float(self.store.glitch_phase[self.slot])
+    
+    @glitch_phase.setter
+    def glitch_phase(self, value: float):
+        self.store.glitch_phase[self.slot] = value
+    
+    @property
+    def instability_phase(self) -> float:
+        return float(self.store.instability_phase[self.slot])
+    
+    @instability_phase.setter
+    def instability_phase(self, value: float):
+        self.store.instability_phase[self.slot] = value
+    
+    @property
+    def corruption_level(self) -> float:
+        return float(self.store.corruption[self.slot])
+    
+    @corruption_level.setter
+    def corruption_level(self, value: float):
+        self.store.corruption[self.slot] = value
+    
+    @property
+    def recalculate_path_timer(self) -> float:
+        return float(self.store.replan_timer[self.slot])
+    
+    @recalculate_path_timer.setter
+    def recalculate_path_timer(self, value: float):
+        self.store.replan_timer[self.slot] = value
+    
+    @property
+    def path_dirty(self) -> bool:
+        return bool(self.store.dirty[self.slot])
+    
+    @path_dirty.setter
+    def path_dirty(self, value: bool):
+        self.store.dirty[self.slot] = value
+    
+    @property
+    def is_captured(self) -> bool:
+        return self._captured
+    
+    @is_captured.setter
+    def is_captured(self, value: bool):
+        self._captured = value
+        self.store.captured[self.slot] = value
+    
+    @property
+    def path_index(self) -> int:
+        return int(self.store.path_index[self.slot])
+    
+    @path_index.setter
+    def path_index(self, value: int):
+        self.store.path_index[self.slot] = value
+        self._load_waypoint()
+    
+    def _load_waypoint(self):
+        """Hand the store the path point the ghost is heading for"""
+        index = self.path_index
+        self.store.has_waypoint[self.slot] = has_waypoint = index < len(self.path)
+        if has_waypoint:
+            self.store.waypoint_x[self.slot], self.store.waypoint_y[self.slot] = self.path[index]
+    
+    def update(self, dt: float, maze, player, other_ghosts: List['DecoherenceGhost'], qubits=None,
+               flow_field=None, path_cache: Optional[PathCache] = None,
+               scheduler: Optional[AIScheduler] = None, qubit_index: Optional[SpatialHash] = None):
+        """Make an AI decision: pick a target, then a path or a path request
+        
+        Chasers follow flow_field, the player's distance field, which only
+        reaches config.CHASE_FIELD_RADIUS cells from the player; chasers
+        further out plan A* paths like the other ghosts. With a scheduler,
+        path searches are queued there instead of run inline. Guardians look
+        up qubits to guard in qubit_index when given, else in qubits.
+        
+        EnemyManager only calls this for the ghosts GhostStore.deciding()
+        picks. Phases and timers advance for all ghosts at once in
+        GhostStore.tick, and movement in GhostStore.step.
+        """
         if self.is_captured:
             return
-            
-        # Update visual effects
-        self.glitch_phase += dt * 8
-        self.instability_phase += dt * 5
-        self.corruption_level = (math.sin(self.instability_phase) + 1) * 0.5
-        
-        # Update pathfinding timer
-        self.recalculate_path_timer -= dt
-        
-        # Type-specific behavior updates
-        if self.ghost_type == GhostType.WANDERER:
-            self.direction_change_timer -= dt
-            if self.direction_change_timer <= 0:
-                self._change_random_direction()
-                self.direction_change_timer = self.direction_change_interval
         
         # Determine target based on state and type
         if self.state == GhostState.FRIGHTENED:
             # All types flee when frightened
-            dx = self.x - player.x
-            dy = self.y - player.y
-            if dx != 0 or dy != 0:
-                length = math.sqrt(dx*dx + dy*dy)
-                self.target_x = self.x + (dx/length) * 100
-                self.target_y = self.y + (dy/length) * 100
+            self.target_x, self.target_y = self._flee_target(maze, player, flow_field)
         else:
-            self._update_target_by_type(player, qubits)
-        
-        # Recalculate path if needed
-        if self.recalculate_path_timer <= 0 or not self.path:
-            if self.ghost_type == GhostType.WANDERER and self.state != GhostState.FRIGHTENED:
-                self._wander_movement(dt, maze)
+            self._update_target_by_type(player, qubits, maze, qubit_index)
+        
+        # Recalculate path if needed (wanderers in normal state roam the corridor graph instead)
+        if (flow_field is not None and self.ghost_type == GhostType.CHASER and
+                self.state == GhostState.CHASE and flow_field[maze.cell_at(self.x, self.y)[::-1]] >= 0):
+            self._follow_flow_field(maze, flow_field, path_cache)
+            self.recalculate_path_timer = 1.0  # Next decision when this step is done
+        elif self.ghost_type == GhostType.WANDERER and self.state != GhostState.FRIGHTENED:
+            # Junction to junction along the corridor graph
+            if self.path_index >= len(self.path) or self.path_dirty:
+                self._wander_to_next_junction(maze)
+                self.path_dirty = False
+            self.recalculate_path_timer = 1.0  # Next decision at the junction
+        elif self.recalculate_path_timer <= 0 or self.path_index >= len(self.path) or self.path_dirty:
+            if scheduler is not None:
+                scheduler.request(self)  # Planned when the frame budget allows
             else:
-                self.path = self._find_path_to_target(maze)
-                self.path_index = 0
-            self.recalculate_path_timer = 1.0  # Recalculate every second
-        
-        # Move along path (except for wanderers in normal state)
-        if not (self.ghost_type == GhostType.WANDERER and self.state != GhostState.FRIGHTENED):
-            self._move_along_path(dt, maze)
+                self.replan(maze, path_cache)
         
         # Handle entanglement
         if self.entangled_with and self.entangled_with.is_captured:
             self.is_captured = True
     
-    def _update_target_by_type(self, player, qubits):
+    def _update_target_by_type(self, player, qubits, maze=None, qubit_index: Optional[SpatialHash] = None):
         """Update target based on ghost type"""
         if self.ghost_type == GhostType.CHASER:
             if self.state == GhostState.CHASE:
                 self.target_x = player.x
                 self.target_y = player.y
             elif self.state == GhostState.SCATTER:
-                corners = [(50, 50), (750, 50), (750, 550), (50, 550)]
+                if maze:
+                    world_width = maze.width * maze.cell_size
+                    world_height = maze.height * maze.cell_size
+                else:
+                    world_width, world_height = 800, 600
+                corners = [(50, 50), (world_width - 50, 50),
+                           (world_width - 50, world_height - 50), (50, world_height - 50)]
                 corner = corners[self.ghost_id % len(corners)]
                 self.target_x, self.target_y = corner
                 
         elif self.ghost_type == GhostType.GUARDIAN:
-            if qubits and self.state == GhostState.CHASE:
+            if (qubits or qubit_index) and self.state == GhostState.CHASE:
                 # Find nearest uncollected qubit to guard
                 nearest_qubit = None
                 min_distance = float('inf')
+                if qubit_index is not None:
+                    # A path is never shorter than the straight line (give or
+                    # take the centre's offset in its cell), so only nearby
+                    # buckets can hold a qubit in range
+                    qubits = qubit_index.query_radius(*self.patrol_center, self.patrol_radius + maze.cell_size)
                 
+                # Path distance, so qubits behind a wall don't count as close
+                # (only searched as far as the patrol radius reaches)
+                field = maze.distance_field(*maze.cell_at(*self.patrol_center),
+                                            self.patrol_radius // maze.cell_size)
                 for qubit in qubits:
                     if not qubit.collected:
-                        distance = math.sqrt((qubit.x - self.patrol_center[0])**2 + 
-                                           (qubit.y - self.patrol_center[1])**2)
-                        if distance < self.patrol_radius and distance < min_distance:
+                        qubit_x, qubit_y = maze.cell_at(qubit.x, qubit.y)
+                        distance = field[qubit_y, qubit_x] * maze.cell_size
+                        if 0 <= distance < self.patrol_radius and distance < min_distance:
                             min_distance = distance
                             nearest_qubit = qubit
                 
@@ -154,185 +431,137 @@ class DecoherenceGhost:
                 # Return to patrol center
                 self.target_x, self.target_y = self.patrol_center
     
-    def _change_random_direction(self):
+    def _flee_target(self, maze, player, field=None) -> Tuple[float, float]:
+        """Point up to ~100 pixels of path away, climbing the player's distance field
+        
+        A ghost outside a cut-off field is far enough away already and stays put.
+        """
+        if field is None:
+            field = maze.distance_field(*maze.cell_at(player.x, player.y), config.CHASE_FIELD_RADIUS)
+        grid_x, grid_y = maze.cell_at(self.x, self.y)
+        if field[grid_y, grid_x] < 0:
+            return maze.cell_center(grid_x, grid_y)
+        
+        for _ in range(max(1, 100 // maze.cell_size)):
+            best = None
+            best_distance = field[grid_y, grid_x]
+            for dx, dy in ((0, -1), (1, 0), (0, 1), (-1, 0)):
+                next_x, next_y = grid_x + dx, grid_y + dy
+                if (0 <= next_x < maze.width and 0 <= next_y < maze.height and
+                        field[next_y, next_x] > best_distance):
+                    best = (next_x, next_y)
+                    best_distance = field[next_y, next_x]
+            if best is None:
+                break  # Dead end, nowhere further from the player
+            grid_x, grid_y = best
+        
+        return maze.cell_center(grid_x, grid_y)
+    
+    def _change_random_direction(self, maze=None):
         """Change to a random direction (for wanderer type)"""
         directions = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+        if maze is not None:
+            # Only the ways out of this cell on the corridor graph, open ones if any
+            grid_x, grid_y = maze.cell_at(self.x, self.y)
+            directions = maze.corridor_graph.exits(grid_x, grid_y) or directions
+            directions = [(dx, dy) for dx, dy in directions
+                          if not maze.solid_cells[grid_y + dy, grid_x + dx]] or directions
         # Avoid immediate reversal
         opposite_direction = (-self.direction[0], -self.direction[1])
         available_directions = [d for d in directions if d != opposite_direction]
         
         if available_directions:
             self.direction = random.choice(available_directions)
+        elif opposite_direction in directions:
+            self.direction = opposite_direction  # Dead end, turn back
     
-    def _wander_movement(self, dt: float, maze):
-        """Simple wandering movement for wanderer type"""
-        move_distance = self.speed * dt * 60
-        
-        new_x = self.x + self.direction[0] * move_distance
-        new_y = self.y + self.direction[1] * move_distance
-        
-        # Check if we can move in current direction
-        if not maze.is_wall_at(new_x, new_y):
-            self.x = new_x
-            self.y = new_y
-        else:
-            # Hit a wall, change direction
-            self._change_random_direction()
-    
-    def _find_path_to_target(self, maze) -> List[Tuple[int, int]]:
-        """Simple pathfinding using A* algorithm"""
-        start_grid_x = int(self.x // maze.cell_size)
-        start_grid_y = int(self.y // maze.cell_size)
-        target_grid_x = int(self.target_x // maze.cell_size)
-        target_grid_y = int(self.target_y // maze.cell_size)
-        
-        # Clamp to maze bounds
-        target_grid_x = max(0, min(maze.width - 1, target_grid_x))
-        target_grid_y = max(0, min(maze.height - 1, target_grid_y))
-        
-        # Simple pathfinding - just move towards target
-        path = []
-        current_x, current_y = start_grid_x, start_grid_y
-        
-        # Add some randomness to prevent getting stuck
-        for _ in range(20):  # Limit iterations
-            if current_x == target_grid_x and current_y == target_grid_y:
-                break
-                
-            # Choose direction towards target
-            dx = 0
-            dy = 0
-            
-            if current_x < target_grid_x:
-                dx = 1
-            elif current_x > target_grid_x:
-                dx = -1
-                
-            if current_y < target_grid_y:
-                dy = 1
-            elif current_y > target_grid_y:
-                dy = -1
-            
-            # Try to move in preferred direction
-            next_x = current_x + dx
-            next_y = current_y + dy
-            
-            # Check if move is valid
-            if (0 <= next_x < maze.width and 0 <= next_y < maze.height and
-                maze.grid[next_y][next_x] != CellType.WALL):
-                current_x, current_y = next_x, next_y
-                path.append((current_x * maze.cell_size + maze.cell_size // 2,
-                           current_y * maze.cell_size + maze.cell_size // 2))
-            else:
-                # Try alternative directions
-                directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-                random.shuffle(directions)
-                
-                for alt_dx, alt_dy in directions:
-                    alt_x = current_x + alt_dx
-                    alt_y = current_y + alt_dy
-                    
-                    if (0 <= alt_x < maze.width and 0 <= alt_y < maze.height and
-                        maze.grid[alt_y][alt_x] != CellType.WALL):
-                        current_x, current_y = alt_x, alt_y
-                        path.append((current_x * maze.cell_size + maze.cell_size // 2,
-                                   current_y * maze.cell_size + maze.cell_size // 2))
-                        break
-                else:
-                    # No valid moves, stop pathfinding
-                    break
-        
-        return path
-        """Simple pathfinding using A* algorithm"""
-        start_grid_x = int(self.x // maze.cell_size)
-        start_grid_y = int(self.y // maze.cell_size)
-        target_grid_x = int(self.target_x // maze.cell_size)
-        target_grid_y = int(self.target_y // maze.cell_size)
-        
-        # Clamp to maze bounds
-        target_grid_x = max(0, min(maze.width - 1, target_grid_x))
-        target_grid_y = max(0, min(maze.height - 1, target_grid_y))
-        
-        # Simple pathfinding - just move towards target
-        path = []
-        current_x, current_y = start_grid_x, start_grid_y
-        
-        # Add some randomness to prevent getting stuck
-        for _ in range(20):  # Limit iterations
-            if current_x == target_grid_x and current_y == target_grid_y:
-                break
-                
-            # Choose direction towards target
-            dx = 0
-            dy = 0
-            
-            if current_x < target_grid_x:
-                dx = 1
-            elif current_x > target_grid_x:
-                dx = -1
-                
-            if current_y < target_grid_y:
-                dy = 1
-            elif current_y > target_grid_y:
-                dy = -1
-            
-            # Try to move in preferred direction
-            next_x = current_x + dx
-            next_y = current_y + dy
-            
-            # Check if move is valid
-            if (0 <= next_x < maze.width and 0 <= next_y < maze.height and
-                maze.grid[next_y][next_x] != CellType.WALL):
-                current_x, current_y = next_x, next_y
-                path.append((current_x * maze.cell_size + maze.cell_size // 2,
-                           current_y * maze.cell_size + maze.cell_size // 2))
-            else:
-                # Try alternative directions
-                directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-                random.shuffle(directions)
-                
-                for alt_dx, alt_dy in directions:
-                    alt_x = current_x + alt_dx
-                    alt_y = current_y + alt_dy
-                    
-                    if (0 <= alt_x < maze.width and 0 <= alt_y < maze.height and
-                        maze.grid[alt_y][alt_x] != CellType.WALL):
-                        current_x, current_y = alt_x, alt_y
-                        path.append((current_x * maze.cell_size + maze.cell_size // 2,
-                                   current_y * maze.cell_size + maze.cell_size // 2))
-                        break
-                else:
-                    # No valid moves, stop pathfinding
+    def _wander_to_next_junction(self, maze):
+        """Pick a way out of the current cell and follow its corridor to the next node"""
+        self._change_random_direction(maze)
+        grid_x, grid_y = maze.cell_at(self.x, self.y)
+        self.path = [maze.cell_center(grid_x, grid_y)]  # Re-centre first
+        graph = maze.corridor_graph
+        if self.direction in graph.exits(grid_x, grid_y):
+            # Stop short of a superposition wall that is solid right now
+            for cell_x, cell_y in graph.corridor(grid_x, grid_y, self.direction):
+                if maze.solid_cells[cell_y, cell_x]:
                     break
-        
-        return path
+                self.path.append(maze.cell_center(cell_x, cell_y))
+        self.path_index = 0
     
-    def _move_along_path(self, dt: float, maze):
-        """Move ghost along the calculated path"""
-        if not self.path or self.path_index >= len(self.path):
-            return
-            
-        target_x, target_y = self.path[self.path_index]
-        
-        # Move towards current path target
-        dx = target_x - self.x
-        dy = target_y - self.y
-        distance = math.sqrt(dx*dx + dy*dy)
+    def replan(self, maze, path_cache: Optional[PathCache] = None):
+        """Search a fresh path to the current target"""
+        self.path = self._find_path_to_target(maze, path_cache)
+        self.path_index = 0
+        self.recalculate_path_timer = 1.0  # Recalculate every second
+        self.path_dirty = False
+    
+    def _find_path_to_target(self, maze, path_cache: Optional[PathCache] = None) -> List[Tuple[int, int]]:
+        """A* path (cell centres) from the ghost to its target, shared through path_cache"""
+        start_x, start_y = maze.cell_at(self.x, self.y)
+        goal = maze.cell_at(self.target_x, self.target_y)
+        cells = None
+        # D* Lite only pays off while the goal stays put: scatter corners and
+        # patrol centres. Moving goals (the player, patrol points, flee
+        # targets) would rebuild it every time, so those use A*.
+        repair = self.incremental and self.state == GhostState.SCATTER
+        if repair:
+            if self.planner is None or self.planner.goal != goal or self.planner.maze is not maze:
+                self.planner = IncrementalPlanner(maze, goal)
+            cells = self.planner.plan((start_x, start_y))
+        elif path_cache is not None:
+            cells = path_cache.get((start_x, start_y), goal, maze.wall_epoch)
+        if cells is None:
+            cells = maze.pathfinder.find_path((start_x, start_y), goal)
+            if path_cache is not None and not repair:
+                path_cache.put((start_x, start_y), goal, cells, maze.wall_epoch)
+        if not cells:
+            return []
+        
+        # Re-centre in the current cell first so turns don't clip walls
+        return [maze.cell_center(start_x, start_y)] + [maze.cell_center(x, y) for x, y in cells]
+    
+    def on_walls_changed(self, cells: List[Tuple[int, int]], centres: Set[Tuple[int, int]]):
+        """Superposition walls flipped: feed the planner, re-plan if the path is hit
+        
+        centres holds the cell centres of the flipped cells, as path points.
+        """
+        if self.planner is not None:
+            self.planner.notify_changed(cells)
+        if self.path and not centres.isdisjoint(self.path[self.path_index:]):
+            self.path_dirty = True
+    
+    def _follow_flow_field(self, maze, field, path_cache: Optional[PathCache] = None):
+        """Plan one step downhill on the player's distance field
+        
+        The field treats superposition walls as open. When the step downhill
+        is a wall that is solid right now, the ghost takes an A* detour
+        instead of waiting for the wall to phase out.
+        """
+        grid_x, grid_y = maze.cell_at(self.x, self.y)
+        if (grid_x, grid_y) == self.flow_cell and self.path_index < len(self.path) and not self.path_dirty:
+            return  # Still on the way to the step planned from this cell
+        self.flow_cell = (grid_x, grid_y)
+        self.path_dirty = False
+        
+        # Neighbour closest to the player
+        best = None
+        best_distance = field[grid_y, grid_x] if field[grid_y, grid_x] >= 0 else maze.width * maze.height
+        for dx, dy in ((0, -1), (1, 0), (0, 1), (-1, 0)):
+            next_x, next_y = grid_x + dx, grid_y + dy
+            if (0 <= next_x < maze.width and 0 <= next_y < maze.height and
+                    0 <= field[next_y, next_x] < best_distance):
+                best = (next_x, next_y)
+                best_distance = field[next_y, next_x]
         
-        if distance < 5:  # Close enough to target
-            self.path_index += 1
+        if best is not None and maze.solid_cells[best[1], best[0]]:
+            self.path = self._find_path_to_target(maze, path_cache)
         else:
-            # Move towards target
-            move_x = (dx / distance) * self.speed * dt * 60
-            move_y = (dy / distance) * self.speed * dt * 60
-            
-            new_x = self.x + move_x
-            new_y = self.y + move_y
-            
-            # Check collision with maze
-            if not maze.is_wall_at(new_x, new_y):
-                self.x = new_x
-                self.y = new_y
+            # Re-centre, then step
+            self.path = [maze.cell_center(grid_x, grid_y)]
+            if best is not None:
+                self.path.append(maze.cell_center(*best))
+        self.path_index = 0
     
     def set_state(self, new_state: GhostState):
         """Change ghost state"""
@@ -366,36 +595,31 @@ class DecoherenceGhost:
             self.radius * 2
         )
     
-    def draw(self, screen):
+    def draw(self, screen, camera=None):
         """Draw the decoherence ghost with glitch effects"""
         if self.is_captured:
             return
+        
+        screen_x, screen_y = to_screen(camera, self.x, self.y)
             
         # Calculate glitch effects
         glitch_offset_x = math.sin(self.glitch_phase) * 3 * self.corruption_level
         glitch_offset_y = math.cos(self.glitch_phase * 1.3) * 2 * self.corruption_level
         
-        draw_x = int(self.x + glitch_offset_x)
-        draw_y = int(self.y + glitch_offset_y)
+        draw_x = int(screen_x + glitch_offset_x)
+        draw_y = int(screen_y + glitch_offset_y)
         
         # Draw type-specific particle trails
-        self._draw_type_effects(screen, draw_x, draw_y)
+        self._draw_type_effects(screen, draw_x, draw_y, camera)
         
         # Draw multiple corrupted versions for glitch effect
         if self.corruption_level > 0.5:
+            jitter = int(self.glitch_phase * 8)
             for i in range(3):
-                offset_x = random.randint(-2, 2)
-                offset_y = random.randint(-2, 2)
+                offset_x, offset_y = GLITCH_JITTER[(jitter + i * 11) % len(GLITCH_JITTER)]
                 alpha = int(100 * (1 - i * 0.3))
-                
-                # Create ghost surface with alpha
-                ghost_surf = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-                color_with_alpha = (*self.glitch_color, alpha)
-                pygame.draw.circle(ghost_surf, color_with_alpha, 
-                                 (self.radius, self.radius), self.radius)
-                
-                screen.blit(ghost_surf, (draw_x - self.radius + offset_x, 
-                                       draw_y - self.radius + offset_y))
+                screen.blit(self.sprites.get('glitch', self.glitch_color, alpha),
+                            (draw_x - self.radius + offset_x, draw_y - self.radius + offset_y))
         
         # Draw main ghost body
         if self.state == GhostState.FRIGHTENED:
@@ -427,15 +651,17 @@ class DecoherenceGhost:
         
         # Draw entanglement connection
         if self.entangled_with and not self.entangled_with.is_captured:
+            other_x, other_y = to_screen(camera, self.entangled_with.x, self.entangled_with.y)
+            
             # Draw quantum entanglement line
             entanglement_color = (0, 255, 255)
             pygame.draw.line(screen, entanglement_color,
-                           (int(self.x), int(self.y)),
-                           (int(self.entangled_with.x), int(self.entangled_with.y)), 2)
+                           (int(screen_x), int(screen_y)),
+                           (int(other_x), int(other_y)), 2)
             
             # Draw entanglement particles
-            mid_x = (self.x + self.entangled_with.x) / 2
-            mid_y = (self.y + self.entangled_with.y) / 2
+            mid_x = (screen_x + other_x) / 2
+            mid_y = (screen_y + other_y) / 2
             
             for i in range(3):
                 particle_phase = self.glitch_phase + i * math.pi / 3
@@ -444,7 +670,7 @@ class DecoherenceGhost:
                 pygame.draw.circle(screen, entanglement_color, 
                                  (int(particle_x), int(particle_y)), 2)
     
-    def _draw_type_effects(self, screen, draw_x: int, draw_y: int):
+    def _draw_type_effects(self, screen, draw_x: int, draw_y: int, camera=None):
         """Draw type-specific visual effects"""
         if self.ghost_type == GhostType.CHASER:
             # Draw pursuit trail
@@ -455,70 +681,95 @@ class DecoherenceGhost:
                     trail_offset = i * 3
                     trail_x = draw_x - self.direction[0] * trail_offset
                     trail_y = draw_y - self.direction[1] * trail_offset
-                    
-                    trail_surf = pygame.Surface((4, 4), pygame.SRCALPHA)
-                    trail_color = (*self.base_color, trail_alpha)
-                    pygame.draw.circle(trail_surf, trail_color, (2, 2), 2)
-                    screen.blit(trail_surf, (trail_x - 2, trail_y - 2))
+                    screen.blit(self.sprites.get('trail', self.base_color, trail_alpha),
+                                (trail_x - 2, trail_y - 2))
         
         elif self.ghost_type == GhostType.WANDERER:
-            # Draw random particle cloud
-            for i in range(8):
-                particle_angle = random.random() * math.pi * 2
-                particle_distance = random.randint(15, 25)
-                particle_x = draw_x + math.cos(particle_angle) * particle_distance
-                particle_y = draw_y + math.sin(particle_angle) * particle_distance
-                
-                particle_alpha = random.randint(50, 150)
-                particle_surf = pygame.Surface((3, 3), pygame.SRCALPHA)
-                particle_color = (*self.base_color, particle_alpha)
-                pygame.draw.circle(particle_surf, particle_color, (1, 1), 1)
-                screen.blit(particle_surf, (particle_x - 1, particle_y - 1))
+            # Draw random particle cloud (a different baked layout every frame or so)
+            variant = int(self.glitch_phase * 8) % WANDERER_CLOUD_VARIANTS
+            screen.blit(self.sprites.cloud(self.base_color, variant), (draw_x - 26, draw_y - 26))
         
         elif self.ghost_type == GhostType.GUARDIAN:
             # Draw patrol area indicator
             if hasattr(self, 'patrol_center'):
                 patrol_alpha = int(30 + 20 * math.sin(self.glitch_phase))
-                patrol_surf = pygame.Surface((self.patrol_radius * 2, self.patrol_radius * 2), pygame.SRCALPHA)
-                patrol_color = (*self.base_color, patrol_alpha)
-                pygame.draw.circle(patrol_surf, patrol_color, 
-                                 (self.patrol_radius, self.patrol_radius), 
-                                 self.patrol_radius, 2)
+                patrol_surf = self.sprites.ring(self.base_color, self.patrol_radius, patrol_alpha)
+                center_x, center_y = to_screen(camera, *self.patrol_center)
                 screen.blit(patrol_surf, 
-                          (self.patrol_center[0] - self.patrol_radius, 
-                           self.patrol_center[1] - self.patrol_radius))
+                          (center_x - self.patrol_radius,
+                           center_y - self.patrol_radius))
 
 class EnemyManager:
-    def __init__(self):
+    def __init__(self, planner: str = 'astar'):
         self.ghosts: List[DecoherenceGhost] = []
+        self.planner = planner  # 'astar', or 'incremental' for D* Lite path repair
         self.state_timer = 0
         self.current_mode = GhostState.CHASE
         
-    def spawn_ghosts(self, maze, count: int = 4):
-        """Spawn decoherence ghosts in the maze"""
+        # Player distance field shared by every chaser, redone when the
+        # player enters a new cell (cut off at CHASE_FIELD_RADIUS cells)
+        self.player_cell = None
+        self.player_field = None
+    
+        # Paths shared between ghosts, dropped when a wall on them flips
+        self.path_cache = PathCache()
+        self.maze = None  # Maze the path cache listens to
+    
+        # Path searches are spread over frames within a time budget
+        self.scheduler = AIScheduler(config.AI_BUDGET_MS)
+    
+        # Positions and path cursors of every ghost, moved in one batch
+        self.store = GhostStore()
+        self.spatial_index = SpatialHash(config.CELL_SIZE)  # Ghosts by maze cell
+    
+    @staticmethod
+    def plan_spawn_positions(maze, count: int = 4,
+                             avoid_position: Optional[Tuple[float, float]] = None) -> List[Tuple[int, int]]:
+        """Pick ghost spawn positions away from avoid_position (the player start)"""
+        # Avoid area where player starts (maze centre by default)
+        if avoid_position is None:
+            avoid_position = (maze.width * maze.cell_size // 2, maze.height * maze.cell_size // 2)
+        
+        # Find suitable spawn positions: more than 100 pixels of path away
+        # (or not reachable at all) from the player start
+        field = maze.distance_field(*maze.cell_at(*avoid_position), 100 // maze.cell_size)
+        distances = field[maze.path_ys, maze.path_xs]
+        away = (distances * maze.cell_size > 100) | (distances < 0)
+        spawn_positions = maze.get_path_positions(away)
+        
+        # Spread the ghosts evenly over the candidates
+        return [spawn_positions[i * len(spawn_positions) // count]
+                for i in range(min(count, len(spawn_positions)))]
+    
+    def spawn_ghosts(self, maze, count: int = 4, avoid_position: Optional[Tuple[float, float]] = None,
+                     positions: Optional[List[Tuple[int, int]]] = None):
+        """Spawn decoherence ghosts in the maze (at pre-planned positions if given)"""
         self.ghosts.clear()
+        self.player_cell = None  # New maze, so a new player field
+        self.player_field = None
+        
+        # Cached paths belong to the old maze
+        if self.maze is not None:
+            self.maze.remove_wall_listener(self._on_walls_changed)
+        self.path_cache.clear()
+        self.scheduler.clear()
+        self.store.clear()
+        maze.add_wall_listener(self._on_walls_changed)
+        self.maze = maze
         
-        # Find suitable spawn positions (away from player start)
-        spawn_positions = []
-        for y in range(maze.height):
-            for x in range(maze.width):
-                if maze.grid[y][x] == CellType.PATH:
-                    center_x = x * maze.cell_size + maze.cell_size // 2
-                    center_y = y * maze.cell_size + maze.cell_size // 2
-                    # Avoid center area where player starts
-                    if (abs(center_x - 400) > 100 or abs(center_y - 300) > 100):
-                        spawn_positions.append((center_x, center_y))
+        if positions is None:
+            positions = self.plan_spawn_positions(maze, count, avoid_position)
         
         # Define ghost type distribution
         ghost_types = [GhostType.CHASER, GhostType.WANDERER, GhostType.GUARDIAN]
         
         # Spawn ghosts
-        for i in range(min(count, len(spawn_positions))):
-            x, y = spawn_positions[i * len(spawn_positions) // count]
+        for i, (x, y) in enumerate(positions):
             
             # Assign ghost type based on index
             ghost_type = ghost_types[i % len(ghost_types)]
-            ghost = DecoherenceGhost(x, y, i, ghost_type)
+            ghost = DecoherenceGhost(x, y, i, ghost_type, self.store)
+            ghost.incremental = self.planner == 'incremental'
             
             # Set up guardian patrol area
             if ghost_type == GhostType.GUARDIAN:
@@ -526,14 +777,25 @@ class EnemyManager:
             
             self.ghosts.append(ghost)
         
+        # Index the new ghosts for collision and proximity queries
+        self.spatial_index = SpatialHash(maze.cell_size)
+        self.store.attach_index(self.spatial_index)
+        
         # Create some entanglements
         if len(self.ghosts) >= 2:
             self.ghosts[0].entangle_with(self.ghosts[1])
         if len(self.ghosts) >= 4:
             self.ghosts[2].entangle_with(self.ghosts[3])
     
-    def update(self, dt: float, maze, player, qubits=None):
-        """Update all ghosts"""
+    def _on_walls_changed(self, cells: List[Tuple[int, int]]):
+        """Maze wall listener: drop stale paths and tell the ghosts"""
+        self.path_cache.invalidate_cells(cells)
+        centres = {self.maze.cell_center(x, y) for x, y in cells}
+        for ghost in self.ghosts:
+            ghost.on_walls_changed(cells, centres)
+    
+    def update(self, dt: float, maze, player, qubits=None, qubit_index: Optional[SpatialHash] = None):
+        """Update all ghosts (guardians guard qubits, or those in qubit_index)"""
         # Update mode timer
         self.state_timer += dt
         
@@ -551,9 +813,35 @@ class EnemyManager:
                 if ghost.state != GhostState.FRIGHTENED:
                     ghost.set_state(self.current_mode)
         
-        # Update individual ghosts
-        for ghost in self.ghosts:
-            ghost.update(dt, maze, player, self.ghosts, qubits)
+        player_cell = maze.cell_at(player.x, player.y)
+        if player_cell != self.player_cell or self.player_field is None:
+            self.player_cell = player_cell
+            self.player_field = maze.distance_field(*player_cell, config.CHASE_FIELD_RADIUS)
+        
+        # Tick every ghost at once, run the AI only for those with a decision
+        # to make (ghosts already queued for a path just wait), then plan the
+        # queued paths within the frame budget
+        self.store.tick(dt)
+        for slot in self.store.deciding():
+            ghost = self.store.ghosts[slot]
+            if ghost not in self.scheduler.pending:
+                ghost.update(dt, maze, player, self.ghosts, qubits, self.player_field, self.path_cache,
+                             self.scheduler, qubit_index)
+        priorities = self._replan_priorities(maze) if self.scheduler.pending else None
+        self.scheduler.run(dt, lambda ghost: priorities[ghost.slot],
+                           lambda ghost: ghost.is_captured or ghost.replan(maze, self.path_cache))
+        self.store.step(dt, maze)
+    
+    def _replan_priorities(self, maze) -> np.ndarray:
+        """Path distance from every ghost to the player, by slot (nearer ghosts plan first)"""
+        n = self.store.count
+        grid_x = np.clip(np.floor_divide(self.store.x[:n], maze.cell_size).astype(np.int32), 0, maze.width - 1)
+        grid_y = np.clip(np.floor_divide(self.store.y[:n], maze.cell_size).astype(np.int32), 0, maze.height - 1)
+        steps = self.player_field[grid_y, grid_x]
+        # Outside the field: after every ghost in it, by straight-line distance
+        player_x, player_y = self.player_cell
+        return np.where(steps >= 0, steps,
+                        config.CHASE_FIELD_RADIUS + np.abs(grid_x - player_x) + np.abs(grid_y - player_y))
     
     def set_frightened_mode(self, duration: float = 5.0):
         """Set all ghosts to frightened mode"""
@@ -566,7 +854,9 @@ class EnemyManager:
     
     def check_collision(self, player_rect: pygame.Rect, player_has_measurement: bool = False) -> bool:
         """Check collision between player and ghosts"""
-        for ghost in self.ghosts:
+        # Only ghosts the spatial index finds near the player, in spawn order
+        nearby = self.spatial_index.query_rect(player_rect, config.GHOST_RADIUS)
+        for ghost in sorted(nearby, key=lambda ghost: ghost.slot):
             if not ghost.is_captured and player_rect.colliderect(ghost.get_rect()):
                 if player_has_measurement or ghost.state == GhostState.FRIGHTENED:
                     # Player can capture ghost
@@ -577,10 +867,21 @@ class EnemyManager:
                     return True
         return False
     
-    def draw(self, screen):
-        """Draw all ghosts"""
+    def draw(self, screen, camera=None):
+        """Draw all ghosts in view"""
         for ghost in self.ghosts:
-            ghost.draw(screen)
+            if self._is_ghost_in_view(ghost, camera):
+                ghost.draw(screen, camera)
+    
+    def _is_ghost_in_view(self, ghost: DecoherenceGhost, camera) -> bool:
+        """Check if a ghost or any of its effects (link line, patrol ring) is in view"""
+        if in_view(camera, ghost.x, ghost.y, 30):
+            return True
+        if ghost.entangled_with and in_view(camera, ghost.entangled_with.x, ghost.entangled_with.y, 30):
+            return True
+        if ghost.ghost_type == GhostType.GUARDIAN:
+            return in_view(camera, ghost.patrol_center[0], ghost.patrol_center[1], ghost.patrol_radius)
+        return False
     
     def all_captured(self) -> bool:
         """Check if all ghosts are captured"""
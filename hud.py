@@ -148,10 +148,17 @@ class RetroHUD:
             progress_width = int(bar_width * progress)
             pygame.draw.rect(screen, color, (bar_x, bar_y, progress_width, bar_height))
     
-    def draw_proximity_alert(self, screen, player, ghosts):
-        """Draw proximity alert when ghosts are near"""
+    def draw_proximity_alert(self, screen, player, ghosts, spatial_index=None):
+        """Draw proximity alert when ghosts are near
+        
+        With a spatial_index (SpatialHash of the ghosts) only ghosts within
+        alert range are looked at.
+        """
         min_distance = float('inf')
         nearest_ghost = None
+        alert_distance = 80
+        if spatial_index is not None:
+            ghosts = spatial_index.query_radius(player.x, player.y, alert_distance)
         
         # Find nearest ghost
         for ghost in ghosts:
@@ -162,7 +169,6 @@ class RetroHUD:
                     nearest_ghost = ghost
         
         # Activate alert if ghost is close
-        alert_distance = 80
         if min_distance < alert_distance:
             self.proximity_alert_active = True
             self.proximity_alert_intensity = 1.0 - (min_distance / alert_distance)
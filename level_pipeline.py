@@ -0,0 +1,142 @@
+"""
+Background level preparation
+
+Generating a maze and placing qubits, ghosts and tunnels is too slow to do
+inside a frame on large mazes. The pipeline builds the next level while
+the current one is played, and next_level() takes the finished LevelPlan
+and applies it in one step.
+
+Carving and spawn planning are pure Python, so on a thread they would
+hold the GIL for long stretches and slow down every frame they overlap.
+They run in a worker process instead, and the maze comes back in the
+binary level format (Maze.to_bytes). A worker thread waits for it, then
+decodes the maze and builds the per-maze caches the first frames need.
+"""
+
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+from maze import Maze
+from maze_cache import MazeCache
+from qubits import QubitManager
+from enemies import EnemyManager
+from tunnels import TunnelManager
+import config
+
+MazeSpec = Tuple[int, int, Optional[int], str, int]  # Width, height, seed, algorithm, cell size
+
+class LevelPlan:
+    """A generated maze plus every spawn position of a level"""
+    def __init__(self, level: int, maze: Maze, start_position: Tuple[int, int],
+                 qubit_positions: List[Tuple[int, int]], entangled_pairs: int,
+                 ghost_positions: List[Tuple[int, int]],
+                 tunnel_positions: Optional[Tuple[Tuple[int, int], Tuple[int, int]]]):
+        self.level = level
+        self.maze = maze
+        self.start_position = start_position
+        self.qubit_positions = qubit_positions
+        self.entangled_pairs = entangled_pairs
+        self.ghost_positions = ghost_positions
+        self.tunnel_positions = tunnel_positions
+
+def plan_level(maze: Maze, level: int, view_size: Optional[Tuple[int, int]] = None) -> LevelPlan:
+    """Place everything for a level in a fresh maze, touching no game state"""
+    return warm_level(plan_spawns(maze, level), view_size)
+
+def plan_spawns(maze: Maze, level: int) -> LevelPlan:
+    """Pick the start and every spawn position of a level"""
+    start_position = maze.get_random_path_position()
+    qubit_positions, entangled_pairs = QubitManager.plan_positions(
+        maze, config.get_qubit_count(level), config.ENTANGLED_PAIRS_PER_LEVEL)
+    ghost_positions = EnemyManager.plan_spawn_positions(
+        maze, config.get_enemy_count(level), start_position)
+    tunnel_positions = TunnelManager.plan_tunnel_pair(maze)
+    return LevelPlan(level, maze, start_position, qubit_positions, entangled_pairs,
+                     ghost_positions, tunnel_positions)
+    
+def warm_level(plan: LevelPlan, view_size: Optional[Tuple[int, int]] = None) -> LevelPlan:
+    """Build the maze caches a level needs from its first frame"""
+    # Built here rather than on the first ghost decision of the level
+    # (corridors are still traced lazily, as wanderers reach them)
+    plan.maze.corridor_graph
+    plan.maze.pathfinder
+    
+    # Have the background around the start ready for the first frame
+    if view_size is not None:
+        plan.maze.prerender_area(*plan.start_position, *view_size)
+    return plan
+    
+def generate_level(width: int, height: int, seed: Optional[int], algorithm: str, cell_size: int,
+                   level: int, cache_dir: Optional[str] = None) -> Tuple[bytes, LevelPlan]:
+    """Worker process entry point: a maze (from the disk cache if seeded) as
+    level bytes, and its spawn plan without the maze"""
+    if cache_dir is None:
+        maze = Maze(width, height, cell_size, algorithm, seed)
+    else:
+        maze = MazeCache(cache_dir).load_or_generate(width, height, seed, algorithm, cell_size)
+    plan = plan_spawns(maze, level)
+    plan.maze = None  # Travels as bytes, much cheaper than pickling it
+    return maze.to_bytes(), plan
+
+def _worker_context():
+    """Fork where the platform has it: a spawned worker re-imports the game's
+    main module, which opens the display and audio on import"""
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+class LevelPipeline:
+    """Prepares one upcoming level at a time (maze in a worker process, plan on a thread)"""
+    def __init__(self, maze_spec: Callable[[int], MazeSpec], view_size: Optional[Tuple[int, int]] = None,
+                 cache_dir: Optional[str] = None):
+        self.maze_spec = maze_spec  # Level number -> maze parameters
+        self.view_size = view_size
+        self.cache_dir = cache_dir  # Seeded levels are saved here (None: no disk cache)
+        self.processes = ProcessPoolExecutor(max_workers=1, mp_context=_worker_context())
+        self.processes.submit(int).result()  # Start (fork) the worker now, before any threads
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='level-prep')
+        self.pending: Optional[Future] = None
+        self.pending_level = None
+    
+    def prepare(self, level: int):
+        """Start building a level in the background"""
+        if self.pending is not None and self.pending_level == level:
+            return
+        self.cancel()
+        self.pending_level = level
+        self.pending = self.executor.submit(self.build, level)
+    
+    def build(self, level: int) -> LevelPlan:
+        """Build a level, waiting on the calling thread for the worker process"""
+        width, height, seed, algorithm, cell_size = self.maze_spec(level)
+        data, plan = self.processes.submit(generate_level, width, height, seed, algorithm, cell_size,
+                                           level, self.cache_dir).result()
+        plan.maze = Maze.from_bytes(data, cell_size)
+        plan.maze.distance_fields.max_bytes = config.DISTANCE_FIELD_CACHE_MB * 1024 * 1024
+        return warm_level(plan, self.view_size)
+    
+    def take(self, level: int) -> LevelPlan:
+        """Hand over a prepared level, waiting for (or building) it if it isn't ready"""
+        pending, pending_level = self.pending, self.pending_level
+        self.pending, self.pending_level = None, None
+        if pending is not None and pending_level == level:
+            return pending.result()
+        if pending is not None:
+            pending.cancel()  # Stale (e.g. the game restarted), drop it
+        return self.build(level)
+    
+    def cancel(self):
+        """Drop the level being prepared (a running build finishes unused)"""
+        if self.pending is not None:
+            self.pending.cancel()
+        self.pending, self.pending_level = None, None
+    
+    def shutdown(self):
+        """Stop the worker thread and process
+        
+        Waits for a maze the process is still carving: a process pool left
+        running at interpreter exit trips over its own closed pipes.
+        """
+        self.cancel()
+        self.executor.shutdown(wait=False)
+        self.processes.shutdown(wait=True, cancel_futures=True)
@@ -1,129 +1,395 @@
 import pygame
 import random
 import math
-from typing import List, Tuple, Set
+import heapq
+import struct
+from collections import OrderedDict
+import numpy as np
+from typing import Callable, List, Tuple, Set, Optional
 from enum import Enum
+from maze_generation import carve_maze
+from distance_fields import DistanceFieldCache, bfs_distances
+from maze_graph import CorridorGraph
+from pathfinding import GridPathfinder
+
+WALL_ALPHA_LEVELS = 16       # Quantized alpha steps for superposition wall tiles
+WALL_PARTICLE_VARIANTS = 4   # Pre-baked particle overlays for solid walls
+STATIC_CHUNK_CELLS = 32      # Background is cached in square chunks of this many cells
+MAX_STATIC_CHUNKS = 64       # Chunks kept before the least recently drawn is dropped
+
+# Binary level format: header, 2 bit planes (path, superposition) over the
+# cells, then float32 phase and frequency for each superposition wall
+LEVEL_MAGIC = b'QMAZ'
+LEVEL_FORMAT_VERSION = 1
+_LEVEL_HEADER = struct.Struct('<4sBBqIII')  # magic, version, has_seed, seed, width, height, walls
 
 class CellType(Enum):
     WALL = 0
     PATH = 1
     SUPERPOSITION_WALL = 2
 
-class SuperpositionWall:
-    def __init__(self, x: int, y: int):
-        self.x = x
-        self.y = y
-        self.phase = random.random() * math.pi * 2
-        self.frequency = 0.5 + random.random() * 1.5  # Varies flicker speed
-        self.is_solid = True
-        self.alpha = 255
+class SuperpositionWallField:
+    """Struct-of-arrays state for every superposition wall in a maze
+    
+    A wall's phase is the pure sinusoid phase0 + frequency * time, so its
+    next solid/transparent flip can be computed analytically. Pending flips
+    live in a heap and only walls whose flip is due are touched per tick.
+    """
+    def __init__(self, xs: np.ndarray, ys: np.ndarray, rng: np.random.Generator = None,
+                 phase0: np.ndarray = None, frequency: np.ndarray = None):
+        count = len(xs)
+        self.xs = np.asarray(xs, dtype=np.int32)
+        self.ys = np.asarray(ys, dtype=np.int32)
+        if rng is None:
+            rng = np.random.default_rng()
+        if phase0 is None:
+            phase0 = rng.random(count) * math.pi * 2
+        if frequency is None:
+            frequency = 0.5 + rng.random(count) * 1.5  # Varies flicker speed
+        # Kept at float32 precision so saved levels replay exactly
+        self.phase0 = np.asarray(phase0, dtype=np.float32).astype(np.float64)
+        self.frequency = np.asarray(frequency, dtype=np.float32).astype(np.float64)
+        self.time = 0.0
         
-    def update(self, dt: float):
-        """Update superposition wall state"""
-        self.phase += dt * self.frequency
+        # Determine if walls are solid based on quantum superposition
+        self.is_solid = np.sin(self.phase0) > 0
+        
+        # Schedule each wall's first flip (next multiple of pi in phase)
+        next_flip = (np.floor(self.phase0 / math.pi) + 1) * math.pi
+        flip_times = (next_flip - self.phase0) / self.frequency
+        self._flip_heap = list(zip(flip_times.tolist(), range(count)))
+        heapq.heapify(self._flip_heap)
+    
+    def __len__(self) -> int:
+        return len(self.xs)
+        
+    @property
+    def phase(self) -> np.ndarray:
+        """Current phase of every wall"""
+        return self.phase0 + self.frequency * self.time
+        
+    @property
+    def alpha(self) -> np.ndarray:
+        """Current alpha of every wall, for visual effect"""
+        return (128 + 127 * np.abs(np.sin(self.phase))).astype(np.int32)
+    
+    def alpha_for(self, indices: np.ndarray) -> np.ndarray:
+        """Current alpha of a subset of walls"""
+        phase = self.phase0[indices] + self.frequency[indices] * self.time
+        return (128 + 127 * np.abs(np.sin(phase))).astype(np.int32)
+        
+    def alpha_of(self, index: int) -> int:
+        """Current alpha of a single wall"""
+        phase = self.phase0[index] + self.frequency[index] * self.time
+        return int(128 + 127 * abs(math.sin(phase)))
+    
+    def update(self, dt: float) -> List[int]:
+        """Advance the clock and flip the walls that are due
+        
+        Returns the indices of the walls that changed state. A long tick can
+        flip a wall more than once; it only counts if it ends up different.
+        """
+        self.time += dt
+        was_solid = {}  # Wall -> state before this tick
+        heap = self._flip_heap
         
-        # Determine if wall is solid based on quantum superposition
-        wave_value = math.sin(self.phase)
-        self.is_solid = wave_value > 0
+        while heap and heap[0][0] <= self.time:
+            flip_time, index = heapq.heappop(heap)
+            was_solid.setdefault(index, self.is_solid[index])
+            self.is_solid[index] = not self.is_solid[index]
+            
+            # Next flip is half a period later; derive it from the crossing
+            # itself so the schedule doesn't drift
+            frequency = self.frequency[index]
+            crossing = round((self.phase0[index] + frequency * flip_time) / math.pi)
+            next_time = ((crossing + 1) * math.pi - self.phase0[index]) / frequency
+            heapq.heappush(heap, (next_time, index))
         
-        # Calculate alpha for visual effect
-        self.alpha = int(128 + 127 * abs(wave_value))
+        return [index for index, solid in was_solid.items() if self.is_solid[index] != solid]
+
+class SuperpositionWall:
+    """Read-only view of one wall stored in a SuperpositionWallField"""
+    def __init__(self, field: SuperpositionWallField, index: int):
+        self.field = field
+        self.index = index
+    
+    @property
+    def x(self) -> int:
+        return int(self.field.xs[self.index])
+    
+    @property
+    def y(self) -> int:
+        return int(self.field.ys[self.index])
+    
+    @property
+    def phase(self) -> float:
+        return float(self.field.phase0[self.index] +
+                     self.field.frequency[self.index] * self.field.time)
+    
+    @property
+    def frequency(self) -> float:
+        return float(self.field.frequency[self.index])
+    
+    @property
+    def is_solid(self) -> bool:
+        return bool(self.field.is_solid[self.index])
+    
+    @property
+    def alpha(self) -> int:
+        return self.field.alpha_of(self.index)
+
+class _GridRow:
+    """Row of the cell array that reads and writes CellType members"""
+    def __init__(self, row: np.ndarray):
+        self._row = row
+    
+    def __getitem__(self, x: int) -> CellType:
+        return CellType(int(self._row[x]))
+    
+    def __setitem__(self, x: int, cell_type: CellType):
+        self._row[x] = cell_type.value
+    
+    def __len__(self) -> int:
+        return len(self._row)
+    
+    def __iter__(self):
+        return (CellType(int(value)) for value in self._row)
+
+class GridView:
+    """Compatibility view so existing code can keep using grid[y][x]"""
+    def __init__(self, cells: np.ndarray):
+        self._cells = cells
+    
+    def __getitem__(self, y: int) -> _GridRow:
+        return _GridRow(self._cells[y])
+    
+    def __len__(self) -> int:
+        return len(self._cells)
+    
+    def __iter__(self):
+        return (_GridRow(row) for row in self._cells)
 
 class Maze:
-    def __init__(self, width: int, height: int, cell_size: int = 20):
+    def __init__(self, width: int, height: int, cell_size: int = 20,
+                 algorithm: str = 'backtracker', seed: Optional[int] = None,
+                 generate: bool = True):
         self.width = width
         self.height = height
         self.cell_size = cell_size
-        self.grid = []
-        self.superposition_walls = []
+        self.algorithm = algorithm  # See maze_generation.ALGORITHMS
+        
+        # Same seed, size and algorithm always give the same level
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)  # Generation
+        self.random = random.Random(seed)       # Spawn position sampling
+        self.cells = np.zeros((height, width), dtype=np.uint8)  # CellType values
+        self.wall_field = SuperpositionWallField(np.empty(0), np.empty(0))
+        self.wall_index = np.full((height, width), -1, dtype=np.int32)  # Cell -> superposition wall
+        self.solid_cells = np.ones((height, width), dtype=bool)  # Walls plus solid superposition walls
+        
+        # Wall change events
+        self.wall_epoch = 0  # Bumped whenever any superposition wall flips
+        self.changed_walls: List[Tuple[int, int]] = []  # Cells flipped this tick
+        self.wall_listeners = []
         
         # Colors
         self.wall_color = (100, 100, 150)
         self.path_color = (20, 20, 40)
         self.superposition_color = (0, 255, 150)
         
-        self.generate_maze()
+        # Walls and paths pre-rendered once per level in chunks (see draw)
+        self.static_chunks: OrderedDict = OrderedDict()
+        self.wall_atlas = None  # Superposition wall tiles (see _build_wall_atlas)
         
+        # Merged collision geometry (see get_collision_rects)
+        self.static_collision_rects: Optional[List[pygame.Rect]] = None
+        self.collision_cache: Optional[Tuple[int, List[pygame.Rect]]] = None  # (wall_epoch, rects)
+        
+        # Path distance maps from popular source cells (see distance_field)
+        self.distance_fields = DistanceFieldCache()
+        self._corridor_graph: Optional[CorridorGraph] = None  # Built on first use
+        self._pathfinder: Optional[GridPathfinder] = None
+        
+        if generate:
+            self.generate_maze()
+        
+    @property
+    def grid(self) -> GridView:
+        """CellType view of the cell array, indexed as grid[y][x]"""
+        return GridView(self.cells)
+    
     def generate_maze(self):
-        """Generate a maze using recursive backtracking algorithm"""
-        # Initialize grid with walls
-        self.grid = [[CellType.WALL for _ in range(self.width)] for _ in range(self.height)]
+        """Generate a maze using the configured carving algorithm"""
+        for _, phase in self.generation_phases():
+            phase()
+    
+    def generation_phases(self) -> List[Tuple[str, Callable[[], None]]]:
+        """The steps of generate_maze, in order, as (name, step) so they can be timed one by one"""
+        return [
+            ('fill', self._fill_walls),
+            ('carve', self._carve_paths),
+            ('superposition_walls', self._add_superposition_walls),
+            ('borders', self._ensure_borders),
+            ('path_index', self._build_path_index),
+            ('solid_cells', self._build_solid_cells),
+            ('reset_caches', self._reset_layout_caches),
+        ]
+    
+    def _fill_walls(self):
+        """Initialize the grid with walls, ready for carving"""
+        self.cells = np.full((self.height, self.width), CellType.WALL.value, dtype=np.uint8)
         
-        # Create paths using recursive backtracking
-        self._carve_paths(1, 1)
+    def _reset_layout_caches(self):
+        """Layout changed, so the cached background and collision geometry must be rebuilt"""
+        self.static_chunks.clear()
+        self.static_collision_rects = None
+        self.collision_cache = None
+        self.distance_fields.clear()
+        self._corridor_graph = None
+        self._pathfinder = None
         
-        # Add superposition walls
-        self._add_superposition_walls()
+    def to_bytes(self) -> bytes:
+        """Serialize the level into the compact binary level format"""
+        field = self.wall_field
+        header = _LEVEL_HEADER.pack(LEVEL_MAGIC, LEVEL_FORMAT_VERSION,
+                                    self.seed is not None, self.seed or 0,
+                                    self.width, self.height, len(field))
+        algorithm = self.algorithm.encode('ascii')
+        return b''.join([
+            header,
+            bytes([len(algorithm)]), algorithm,
+            np.packbits(self.path_mask()).tobytes(),
+            np.packbits(self.superposition_mask()).tobytes(),
+            field.phase0.astype('<f4').tobytes(),
+            field.frequency.astype('<f4').tobytes(),
+        ])
+    
+    @classmethod
+    def from_bytes(cls, data: bytes, cell_size: int = 20) -> 'Maze':
+        """Rebuild a level saved with to_bytes, without regenerating it"""
+        magic, version, has_seed, seed, width, height, wall_count = _LEVEL_HEADER.unpack_from(data)
+        if magic != LEVEL_MAGIC or version != LEVEL_FORMAT_VERSION:
+            raise ValueError("Not a quantum maze level (or an unsupported format version)")
         
-        # Ensure borders are always walls
-        self._ensure_borders()
+        offset = _LEVEL_HEADER.size
+        algorithm_length = data[offset]
+        algorithm = data[offset + 1:offset + 1 + algorithm_length].decode('ascii')
+        offset += 1 + algorithm_length
         
-    def _carve_paths(self, x: int, y: int, depth: int = 0):
-        """Carve paths through the maze using recursive backtracking"""
-        # Prevent infinite recursion
-        if depth > 1000:
-            return
-            
-        self.grid[y][x] = CellType.PATH
+        cell_count = width * height
+        plane_size = (cell_count + 7) // 8
+        buffer = np.frombuffer(data, dtype=np.uint8)
+        path = np.unpackbits(buffer[offset:offset + plane_size], count=cell_count)
+        offset += plane_size
+        superposition = np.unpackbits(buffer[offset:offset + plane_size], count=cell_count)
+        offset += plane_size
+        phase0 = np.frombuffer(data, dtype='<f4', count=wall_count, offset=offset)
+        offset += 4 * wall_count
+        frequency = np.frombuffer(data, dtype='<f4', count=wall_count, offset=offset)
         
-        # Define directions (up, right, down, left)
-        directions = [(0, -2), (2, 0), (0, 2), (-2, 0)]
-        random.shuffle(directions)
+        maze = cls(width, height, cell_size, algorithm, seed if has_seed else None, generate=False)
+        cells = np.full(cell_count, CellType.WALL.value, dtype=np.uint8)
+        cells[path.astype(bool)] = CellType.PATH.value
+        cells[superposition.astype(bool)] = CellType.SUPERPOSITION_WALL.value
+        maze.cells = cells.reshape(height, width)
         
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            
-            # Check if the new position is valid and unvisited
-            if (0 < nx < self.width - 1 and 
-                0 < ny < self.height - 1 and 
-                self.grid[ny][nx] == CellType.WALL):
-                
-                # Carve the wall between current and next cell
-                self.grid[y + dy // 2][x + dx // 2] = CellType.PATH
-                self._carve_paths(nx, ny, depth + 1)
+        ys, xs = np.nonzero(maze.superposition_mask())
+        maze._set_wall_field(SuperpositionWallField(xs, ys, phase0=phase0, frequency=frequency))
+        maze._build_path_index()
+        maze._build_solid_cells()
+        return maze
+    
+    def _carve_paths(self):
+        """Carve paths through the maze with the selected generation algorithm"""
+        carve_maze(self.cells, self.algorithm, self.rng)
     
     def _add_superposition_walls(self):
         """Add superposition walls to the maze"""
-        self.superposition_walls.clear()
-        
-        # Convert some regular walls to superposition walls
-        for y in range(1, self.height - 1):
-            for x in range(1, self.width - 1):
-                if self.grid[y][x] == CellType.WALL:
-                    # 15% chance to become a superposition wall
-                    if random.random() < 0.15:
-                        # Only if it's not a structural wall (has paths on both sides)
-                        if self._can_be_superposition_wall(x, y):
-                            self.grid[y][x] = CellType.SUPERPOSITION_WALL
-                            self.superposition_walls.append(SuperpositionWall(x, y))
+        # Convert some regular walls to superposition walls: each interior
+        # wall has a 15% chance, but only if it's not a structural wall
+        interior = np.zeros(self.cells.shape, dtype=bool)
+        interior[1:-1, 1:-1] = True
+        candidates = (self.wall_mask() & interior &
+                      (self.rng.random(self.cells.shape) < 0.15) &
+                      self._superposition_candidates())
+        
+        ys, xs = np.nonzero(candidates)
+        self.cells[ys, xs] = CellType.SUPERPOSITION_WALL.value
+        self._set_wall_field(SuperpositionWallField(xs, ys, self.rng))
+    
+    def _set_wall_field(self, field: SuperpositionWallField):
+        """Install the superposition wall field and its cell index"""
+        self.wall_index = np.full((self.height, self.width), -1, dtype=np.int32)
+        self.wall_index[field.ys, field.xs] = np.arange(len(field), dtype=np.int32)
+        self.wall_field = field
+    
+    def _superposition_candidates(self) -> np.ndarray:
+        """Mask of cells that could become superposition walls"""
+        # Only walls with exactly 2 adjacent paths can be superposition walls
+        return self.neighbour_counts(self.path_mask()) == 2
     
     def _can_be_superposition_wall(self, x: int, y: int) -> bool:
         """Check if a wall can become a superposition wall"""
-        # Count adjacent paths
-        path_count = 0
-        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-            nx, ny = x + dx, y + dy
-            if (0 <= nx < self.width and 0 <= ny < self.height and 
-                self.grid[ny][nx] == CellType.PATH):
-                path_count += 1
-        
-        # Only walls with exactly 2 adjacent paths can be superposition walls
-        return path_count == 2
+        return bool(self._superposition_candidates()[y, x])
     
     def _ensure_borders(self):
         """Ensure maze borders are always solid walls"""
-        for x in range(self.width):
-            self.grid[0][x] = CellType.WALL
-            self.grid[self.height - 1][x] = CellType.WALL
+        self.cells[0, :] = CellType.WALL.value
+        self.cells[-1, :] = CellType.WALL.value
+        self.cells[:, 0] = CellType.WALL.value
+        self.cells[:, -1] = CellType.WALL.value
             
-        for y in range(self.height):
-            self.grid[y][0] = CellType.WALL
-            self.grid[y][self.width - 1] = CellType.WALL
+    def path_mask(self) -> np.ndarray:
+        """Boolean (height, width) mask of open path cells"""
+        return self.cells == CellType.PATH.value
+    
+    def wall_mask(self) -> np.ndarray:
+        """Boolean (height, width) mask of permanent wall cells"""
+        return self.cells == CellType.WALL.value
+    
+    def superposition_mask(self) -> np.ndarray:
+        """Boolean (height, width) mask of superposition wall cells"""
+        return self.cells == CellType.SUPERPOSITION_WALL.value
+    
+    @staticmethod
+    def neighbour_counts(mask: np.ndarray) -> np.ndarray:
+        """Count how many of each cell's 4 neighbours are set in mask"""
+        counts = np.zeros(mask.shape, dtype=np.uint8)
+        counts[1:, :] += mask[:-1, :]
+        counts[:-1, :] += mask[1:, :]
+        counts[:, 1:] += mask[:, :-1]
+        counts[:, :-1] += mask[:, 1:]
+        return counts
+    
+    def get_superposition_wall(self, grid_x: int, grid_y: int):
+        """Get the superposition wall occupying a grid cell, if any"""
+        index = self.wall_index[grid_y, grid_x]
+        if index < 0:
+            return None
+        return SuperpositionWall(self.wall_field, int(index))  # Views are cheap, made on demand
     
     def update(self, dt: float):
         """Update maze state (mainly superposition walls)"""
-        for wall in self.superposition_walls:
-            wall.update(dt)
+        changed = self.wall_field.update(dt)
+        if changed:
+            field = self.wall_field
+            self.solid_cells[field.ys[changed], field.xs[changed]] = field.is_solid[changed]
+        self.changed_walls = [(int(self.wall_field.xs[i]), int(self.wall_field.ys[i]))
+                              for i in changed]
+        
+        if self.changed_walls:
+            self.wall_epoch += 1
+            for listener in self.wall_listeners:
+                listener(self.changed_walls)
+    
+    def add_wall_listener(self, callback):
+        """Register callback(changed_cells) for superposition wall flips"""
+        self.wall_listeners.append(callback)
+    
+    def remove_wall_listener(self, callback):
+        """Unregister a wall flip callback"""
+        if callback in self.wall_listeners:
+            self.wall_listeners.remove(callback)
     
     def is_wall_at(self, x: int, y: int, player_has_superposition: bool = False) -> bool:
         """Check if there's a solid wall at the given position"""
@@ -133,110 +399,308 @@ class Maze:
         if not (0 <= grid_x < self.width and 0 <= grid_y < self.height):
             return True  # Out of bounds is considered a wall
             
-        cell_type = self.grid[grid_y][grid_x]
+        cell_type = self.cells[grid_y, grid_x]
         
-        if cell_type == CellType.WALL:
+        if cell_type == CellType.WALL.value:
             return True
-        elif cell_type == CellType.PATH:
+        elif cell_type == CellType.PATH.value:
             return False
-        elif cell_type == CellType.SUPERPOSITION_WALL:
-            # Find the corresponding superposition wall
-            for wall in self.superposition_walls:
-                if wall.x == grid_x and wall.y == grid_y:
-                    # If player has superposition power-up, they can pass through
-                    if player_has_superposition:
-                        return False
-                    return wall.is_solid
-            return True  # Default to solid if wall not found
+        elif cell_type == CellType.SUPERPOSITION_WALL.value:
+            wall = self.get_superposition_wall(grid_x, grid_y)
+            if wall is None:
+                return True  # Default to solid if wall not found
+            # If player has superposition power-up, they can pass through
+            if player_has_superposition:
+                return False
+            return wall.is_solid
         
         return False
     
+    def walls_at(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """is_wall_at for arrays of positions in one pass (superposition walls by current state)"""
+        grid_x = np.floor_divide(xs, self.cell_size).astype(np.intp)
+        grid_y = np.floor_divide(ys, self.cell_size).astype(np.intp)
+        inside = (grid_x >= 0) & (grid_x < self.width) & (grid_y >= 0) & (grid_y < self.height)
+        walls = ~inside  # Out of bounds is considered a wall
+        walls[inside] = self.solid_cells[grid_y[inside], grid_x[inside]]
+        return walls
+    
     def get_collision_rects(self, player_has_superposition: bool = False) -> List[pygame.Rect]:
-        """Get collision rectangles for all solid walls"""
-        rects = []
-        
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.is_wall_at(x * self.cell_size + self.cell_size // 2, 
-                                 y * self.cell_size + self.cell_size // 2, 
-                                 player_has_superposition):
-                    rect = pygame.Rect(
-                        x * self.cell_size,
-                        y * self.cell_size,
-                        self.cell_size,
-                        self.cell_size
-                    )
-                    rects.append(rect)
-        
-        return rects
-    
-    def draw(self, screen):
-        """Draw the maze"""
-        for y in range(self.height):
-            for x in range(self.width):
-                rect = pygame.Rect(
-                    x * self.cell_size,
-                    y * self.cell_size,
-                    self.cell_size,
-                    self.cell_size
-                )
-                
-                cell_type = self.grid[y][x]
+        """Get collision rectangles for all solid walls
+        
+        Permanent walls are greedy-meshed into large rectangles once per
+        layout; solid superposition walls are added as single cells and
+        rebuilt only when a wall flips. The returned list is shared, so
+        don't modify it.
+        """
+        if self.static_collision_rects is None:
+            self.static_collision_rects = self._mesh_rects(self.wall_mask())
+        
+        # Superposition walls never block a player with the power-up
+        if player_has_superposition:
+            return self.static_collision_rects
+        
+        if self.collision_cache is None or self.collision_cache[0] != self.wall_epoch:
+            field = self.wall_field
+            solid = np.flatnonzero(field.is_solid)
+            rects = self.static_collision_rects + [
+                pygame.Rect(x * self.cell_size, y * self.cell_size, self.cell_size, self.cell_size)
+                for x, y in zip(field.xs[solid].tolist(), field.ys[solid].tolist())
+            ]
+            self.collision_cache = (self.wall_epoch, rects)
+        return self.collision_cache[1]
+    
+    def _mesh_rects(self, mask: np.ndarray) -> List[pygame.Rect]:
+        """Merge the cells of a mask into few rectangles (greedy meshing)
+        
+        Each row is split into horizontal runs, and a run is stacked onto
+        the rectangle above it when that rectangle spans the same columns.
+        """
+        # Run starts and ends from the edges of each padded row
+        padded = np.zeros((mask.shape[0], mask.shape[1] + 2), dtype=np.int8)
+        padded[:, 1:-1] = mask
+        edges = np.diff(padded, axis=1)
+        run_ys, run_starts = np.nonzero(edges == 1)
+        _, run_ends = np.nonzero(edges == -1)  # Same row-major order as the starts
+        
+        merged = []
+        open_rects = {}  # (start, end) -> [x, y, width, height] of the rect above
+        for y, start, end in zip(run_ys.tolist(), run_starts.tolist(), run_ends.tolist()):
+            rect = open_rects.get((start, end))
+            if rect is not None and rect[1] + rect[3] == y:
+                rect[3] += 1
+            else:
+                rect = [start, y, end - start, 1]
+                open_rects[(start, end)] = rect
+                merged.append(rect)
+        
+        size = self.cell_size
+        return [pygame.Rect(x * size, y * size, width * size, height * size)
+                for x, y, width, height in merged]
+    
+    def _render_static_chunk(self, chunk_x: int, chunk_y: int) -> pygame.Surface:
+        """Render the walls and paths of one chunk into a background surface
+        
+        Superposition cells get the path colour as their base; their
+        flickering effect is drawn on top every frame.
+        """
+        x0, y0 = chunk_x * STATIC_CHUNK_CELLS, chunk_y * STATIC_CHUNK_CELLS
+        x1 = min(self.width, x0 + STATIC_CHUNK_CELLS)
+        y1 = min(self.height, y0 + STATIC_CHUNK_CELLS)
+        
+        layer = pygame.Surface(((x1 - x0) * self.cell_size, (y1 - y0) * self.cell_size))
+        layer.fill(self.path_color)
+        
+        ys, xs = np.nonzero(self.wall_mask()[y0:y1, x0:x1])
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            rect = pygame.Rect(
+                x * self.cell_size,
+                y * self.cell_size,
+                self.cell_size,
+                self.cell_size
+            )
+            pygame.draw.rect(layer, self.wall_color, rect)
+            # Add subtle border
+            pygame.draw.rect(layer, (150, 150, 200), rect, 1)
+        
+        return layer
+    
+    def _get_static_chunk(self, chunk_x: int, chunk_y: int) -> pygame.Surface:
+        """Get a cached background chunk, rendering it (and evicting the oldest) if needed"""
+        key = (chunk_x, chunk_y)
+        chunk = self.static_chunks.get(key)
+        if chunk is None:
+            chunk = self._render_static_chunk(chunk_x, chunk_y)
+            self.static_chunks[key] = chunk
+            if len(self.static_chunks) > MAX_STATIC_CHUNKS:
+                self.static_chunks.popitem(last=False)
+        else:
+            self.static_chunks.move_to_end(key)
+        return chunk
+    
+    def prerender_area(self, center_x: float, center_y: float, width: int, height: int):
+        """Render the background chunks of an area (in pixels) ahead of drawing it"""
+        chunk_pixels = STATIC_CHUNK_CELLS * self.cell_size
+        chunks_x = (self.width + STATIC_CHUNK_CELLS - 1) // STATIC_CHUNK_CELLS
+        chunks_y = (self.height + STATIC_CHUNK_CELLS - 1) // STATIC_CHUNK_CELLS
+        x0 = max(0, int(center_x - width // 2) // chunk_pixels)
+        y0 = max(0, int(center_y - height // 2) // chunk_pixels)
+        x1 = min(chunks_x, int(center_x + width // 2) // chunk_pixels + 1)
+        y1 = min(chunks_y, int(center_y + height // 2) // chunk_pixels + 1)
+        for chunk_y in range(y0, y1):
+            for chunk_x in range(x0, x1):
+                self._get_static_chunk(chunk_x, chunk_y)
+    
+    def _build_wall_atlas(self) -> List[pygame.Surface]:
+        """Pre-build superposition wall tiles at quantized alpha levels
+        
+        Each tile is the path-coloured base with the superposition colour
+        blended on top, so a wall draws with one opaque blit. Tiles for
+        solid walls come in a few variants with quantum particles baked in.
+        Tile index is level * (1 + WALL_PARTICLE_VARIANTS) + (0 if
+        transparent else 1 + variant).
+        """
+        tiles = []
+        size = self.cell_size
+        overlay = pygame.Surface((size, size))
+        overlay.fill(self.superposition_color)
+        
+        for level in range(WALL_ALPHA_LEVELS):
+            alpha = 128 + round(127 * level / (WALL_ALPHA_LEVELS - 1))
+            tile = pygame.Surface((size, size))
+            tile.fill(self.path_color)
+            overlay.set_alpha(alpha)
+            tile.blit(overlay, (0, 0))
+            tiles.append(tile)
+            
+            # Add quantum "particles" effect
+            for variant in range(WALL_PARTICLE_VARIANTS):
+                solid_tile = tile.copy()
+                for i in range(3):
+                    particle_x = size // 2 + random.randint(-5, 5)
+                    particle_y = size // 2 + random.randint(-5, 5)
+                    pygame.draw.circle(solid_tile, (255, 255, 255),
+                                     (particle_x, particle_y), 1)
+                tiles.append(solid_tile)
+        
+        return tiles
+    
+    def draw(self, screen, camera=None):
+        """Draw the part of the maze in view"""
+        if camera:
+            x0, y0, x1, y1 = camera.get_visible_cells(self.cell_size, self.width, self.height)
+            offset_x, offset_y = camera.offset
+        else:
+            x0, y0, x1, y1 = 0, 0, self.width, self.height
+            offset_x, offset_y = 0, 0
+        if x0 >= x1 or y0 >= y1:
+            return
+        
+        # Blit the pre-rendered background chunks covering the view
+        chunk_pixels = STATIC_CHUNK_CELLS * self.cell_size
+        for chunk_y in range(y0 // STATIC_CHUNK_CELLS, (y1 - 1) // STATIC_CHUNK_CELLS + 1):
+            for chunk_x in range(x0 // STATIC_CHUNK_CELLS, (x1 - 1) // STATIC_CHUNK_CELLS + 1):
+                screen.blit(self._get_static_chunk(chunk_x, chunk_y),
+                            (chunk_x * chunk_pixels - offset_x, chunk_y * chunk_pixels - offset_y))
+        
+        if self.wall_atlas is None:
+            self.wall_atlas = self._build_wall_atlas()
+        
+        # Only superposition walls change, so only the visible ones are
+        # redrawn: pick each wall's atlas tile from its quantized alpha
+        # and solidity
+        visible = self.wall_index[y0:y1, x0:x1]
+        indices = visible[visible >= 0]
+        if not len(indices):
+            return
+        field = self.wall_field
+        levels = (field.alpha_for(indices) - 128) * (WALL_ALPHA_LEVELS - 1) // 127
+        variants = np.where(field.is_solid[indices],
+                            1 + np.random.randint(0, WALL_PARTICLE_VARIANTS, len(indices)), 0)
+        tile_indices = levels * (1 + WALL_PARTICLE_VARIANTS) + variants
+        screen_xs = field.xs[indices] * self.cell_size - offset_x
+        screen_ys = field.ys[indices] * self.cell_size - offset_y
                 
-                if cell_type == CellType.WALL:
-                    pygame.draw.rect(screen, self.wall_color, rect)
-                    # Add subtle border
-                    pygame.draw.rect(screen, (150, 150, 200), rect, 1)
-                    
-                elif cell_type == CellType.PATH:
-                    pygame.draw.rect(screen, self.path_color, rect)
-                    
-                elif cell_type == CellType.SUPERPOSITION_WALL:
-                    # Find the corresponding superposition wall for visual effects
-                    wall = None
-                    for sw in self.superposition_walls:
-                        if sw.x == x and sw.y == y:
-                            wall = sw
-                            break
-                    
-                    if wall:
-                        # Create flickering effect
-                        color = list(self.superposition_color)
-                        alpha = wall.alpha
-                        
-                        # Create surface with alpha
-                        surf = pygame.Surface((self.cell_size, self.cell_size))
-                        surf.set_alpha(alpha)
-                        surf.fill(color)
-                        
-                        # Draw base (path color)
-                        pygame.draw.rect(screen, self.path_color, rect)
-                        
-                        # Draw superposition effect
-                        screen.blit(surf, rect.topleft)
-                        
-                        # Add quantum "particles" effect
-                        if wall.is_solid:
-                            for i in range(3):
-                                particle_x = rect.centerx + random.randint(-5, 5)
-                                particle_y = rect.centery + random.randint(-5, 5)
-                                pygame.draw.circle(screen, (255, 255, 255), 
-                                                 (particle_x, particle_y), 1)
+        atlas = self.wall_atlas
+        screen.blits([(atlas[i], (x, y))
+                      for i, x, y in zip(tile_indices.tolist(), screen_xs.tolist(), screen_ys.tolist())],
+                     doreturn=False)
+    
+    def _build_path_index(self):
+        """Build the immutable index of path cells used by every spawner"""
+        ys, xs = np.nonzero(self.path_mask())
+        self.path_xs = xs.astype(np.int32)
+        self.path_ys = ys.astype(np.int32)
+        self.path_xs.flags.writeable = False
+        self.path_ys.flags.writeable = False
+    
+    def _build_solid_cells(self):
+        """Mask of cells that currently block movement (kept in step by update)"""
+        self.solid_cells = self.wall_mask()
+        self.solid_cells[self.wall_field.ys, self.wall_field.xs] = self.wall_field.is_solid
+    
+    def cell_center(self, grid_x: int, grid_y: int) -> Tuple[int, int]:
+        """Pixel position of the centre of a grid cell"""
+        return (grid_x * self.cell_size + self.cell_size // 2,
+                grid_y * self.cell_size + self.cell_size // 2)
+    
+    def cell_at(self, x: float, y: float) -> Tuple[int, int]:
+        """Grid cell containing a pixel position, clamped to the maze"""
+        return (max(0, min(self.width - 1, int(x // self.cell_size))),
+                max(0, min(self.height - 1, int(y // self.cell_size))))
+    
+    def distance_field(self, grid_x: int, grid_y: int, max_distance: Optional[int] = None) -> np.ndarray:
+        """Path distance in cells from a cell to every cell (-1 if unreachable)
+        
+        With max_distance, cells further than that are -1 too and the search
+        costs that radius rather than the whole maze. Superposition walls
+        count as open, so a field stays valid for the whole level. Fields
+        are cached and shared; don't modify them.
+        """
+        field = self.distance_fields.lookup(grid_x, grid_y, max_distance)
+        if field is None:
+            passable = self.cells != CellType.WALL.value
+            field = self.distance_fields.store(
+                grid_x, grid_y, bfs_distances(passable, grid_x, grid_y, max_distance), max_distance)
+        return field
+    
+    @property
+    def corridor_graph(self) -> CorridorGraph:
+        """Junction graph of the maze with corridors as weighted edges"""
+        if self._corridor_graph is None:
+            self._corridor_graph = CorridorGraph(self.cells != CellType.WALL.value)
+        return self._corridor_graph
+    
+    @property
+    def pathfinder(self) -> GridPathfinder:
+        """Shared A* search over this maze"""
+        if self._pathfinder is None:
+            self._pathfinder = GridPathfinder(self)
+        return self._pathfinder
+    
+    def get_path_cell_count(self) -> int:
+        """Number of open path cells in the maze"""
+        return len(self.path_xs)
+    
+    def get_path_positions(self, mask: np.ndarray = None) -> List[Tuple[int, int]]:
+        """Pixel centres of all path cells (optionally filtered by a mask over the index)"""
+        xs, ys = self.path_xs, self.path_ys
+        if mask is not None:
+            xs, ys = xs[mask], ys[mask]
+        return list(zip((xs * self.cell_size + self.cell_size // 2).tolist(),
+                        (ys * self.cell_size + self.cell_size // 2).tolist()))
+    
+    def sample_path_positions(self, count: int) -> List[Tuple[int, int]]:
+        """Pick distinct random path positions"""
+        count = min(count, len(self.path_xs))
+        return [self.cell_center(int(self.path_xs[i]), int(self.path_ys[i]))
+                for i in self.random.sample(range(len(self.path_xs)), count)]
     
     def get_random_path_position(self) -> Tuple[int, int]:
         """Get a random position that's on a path"""
-        path_positions = []
-        
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.grid[y][x] == CellType.PATH:
-                    path_positions.append((
-                        x * self.cell_size + self.cell_size // 2,
-                        y * self.cell_size + self.cell_size // 2
-                    ))
-        
-        if path_positions:
-            return random.choice(path_positions)
+        if len(self.path_xs):
+            i = self.random.randrange(len(self.path_xs))
+            return self.cell_center(int(self.path_xs[i]), int(self.path_ys[i]))
         else:
             # Fallback to center if no paths found
             return (self.width * self.cell_size // 2, self.height * self.cell_size // 2)
+    
+    def get_random_free_position(self, occupied: Set[Tuple[int, int]]) -> Optional[Tuple[int, int]]:
+        """Get a random path position whose cell isn't in occupied (grid cells)"""
+        count = len(self.path_xs)
+        if count == 0:
+            return None
+        
+        # Occupied cells are normally rare, so a few random tries almost always hit
+        for _ in range(8):
+            i = self.random.randrange(count)
+            cell = (int(self.path_xs[i]), int(self.path_ys[i]))
+            if cell not in occupied:
+                return self.cell_center(*cell)
+        
+        free = [i for i in range(count)
+                if (int(self.path_xs[i]), int(self.path_ys[i])) not in occupied]
+        if not free:
+            return None
+        i = self.random.choice(free)
+        return self.cell_center(int(self.path_xs[i]), int(self.path_ys[i]))
@@ -0,0 +1,61 @@
+"""
+On-disk cache of generated mazes
+
+Seeded levels are fully determined by (seed, width, height, algorithm), so
+the first generation is saved in the binary level format (see
+Maze.to_bytes) and later runs load it with a single read instead of
+carving again. Unseeded mazes are random every time and never cached.
+"""
+
+import os
+import hashlib
+import tempfile
+from typing import Optional
+from maze import Maze, LEVEL_FORMAT_VERSION
+
+class MazeCache:
+    """Content-addressed directory of saved levels"""
+    def __init__(self, directory: str):
+        self.directory = directory
+    
+    def path_for(self, width: int, height: int, seed: int, algorithm: str) -> str:
+        """File a level with these parameters is stored in"""
+        key = f"{LEVEL_FORMAT_VERSION}:{seed}:{width}:{height}:{algorithm}"
+        digest = hashlib.sha1(key.encode('ascii')).hexdigest()
+        return os.path.join(self.directory, f"{digest}.qmaz")
+    
+    def load(self, width: int, height: int, seed: int, algorithm: str,
+             cell_size: int = 20) -> Optional[Maze]:
+        """Load a saved level, or None if it isn't cached (or is unreadable)"""
+        try:
+            with open(self.path_for(width, height, seed, algorithm), 'rb') as f:
+                data = f.read()
+            return Maze.from_bytes(data, cell_size)
+        except (OSError, ValueError):
+            return None
+    
+    def save(self, maze: Maze):
+        """Write a seeded level atomically so readers never see half a file"""
+        if maze.seed is None:
+            return
+        path = self.path_for(maze.width, maze.height, maze.seed, maze.algorithm)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(maze.to_bytes())
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # The cache is only an optimization
+    
+    def load_or_generate(self, width: int, height: int, seed: Optional[int] = None,
+                         algorithm: str = 'backtracker', cell_size: int = 20) -> Maze:
+        """Cached level for a seed, generating and saving it on a miss"""
+        if seed is None:
+            return Maze(width, height, cell_size, algorithm)
+        
+        maze = self.load(width, height, seed, algorithm, cell_size)
+        if maze is None:
+            maze = Maze(width, height, cell_size, algorithm, seed)
+            self.save(maze)
+        return maze
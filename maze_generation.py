@@ -0,0 +1,283 @@
+"""
+Maze generation algorithms
+
+Every algorithm carves a perfect maze on the odd "lattice" cells of a
+width x height grid (cell (i, j) of the lattice sits at grid position
+(2i + 1, 2j + 1)). Algorithms return two boolean passage arrays:
+
+- east[j, i]  - lattice cell (i, j) is open to its east neighbour
+- south[j, i] - lattice cell (i, j) is open to its south neighbour
+
+carve_maze() writes those passages into a uint8 cell array, so no
+algorithm ever touches the grid cell by cell or recurses.
+"""
+
+import numpy as np
+from itertools import permutations
+from typing import Callable, Dict, Tuple
+
+WALL = 0
+PATH = 1
+
+# Every ordering of (north, east, south, west), picked per lattice cell
+_DIRECTION_ORDERS = [list(order) for order in permutations(range(4))]
+
+def lattice_size(width: int, height: int) -> Tuple[int, int]:
+    """Number of carvable lattice cells across and down"""
+    return max(0, (width - 1) // 2), max(0, (height - 1) // 2)
+
+def carve_backtracker(cols: int, rows: int, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """Depth-first recursive backtracker using an explicit stack"""
+    count = cols * rows
+    east = bytearray(count)
+    south = bytearray(count)
+    if count == 0:
+        return _passages(east, south, cols, rows)
+
+    visited = bytearray(count)
+    cursor = bytearray(count)  # How many directions each cell has tried
+    orders = rng.integers(0, len(_DIRECTION_ORDERS), size=count).tolist()
+    direction_orders = _DIRECTION_ORDERS
+    last_col = cols - 1
+    last_row_start = count - cols
+
+    visited[0] = 1
+    stack = [0]
+    while stack:
+        cell = stack[-1]
+        tried = cursor[cell]
+        if tried == 4:
+            stack.pop()
+            continue
+        cursor[cell] = tried + 1
+
+        direction = direction_orders[orders[cell]][tried]
+        if direction == 0:  # North
+            if cell < cols:
+                continue
+            neighbour = cell - cols
+            if visited[neighbour]:
+                continue
+            south[neighbour] = 1
+        elif direction == 1:  # East
+            if cell % cols == last_col:
+                continue
+            neighbour = cell + 1
+            if visited[neighbour]:
+                continue
+            east[cell] = 1
+        elif direction == 2:  # South
+            if cell >= last_row_start:
+                continue
+            neighbour = cell + cols
+            if visited[neighbour]:
+                continue
+            south[cell] = 1
+        else:  # West
+            if cell % cols == 0:
+                continue
+            neighbour = cell - 1
+            if visited[neighbour]:
+                continue
+            east[neighbour] = 1
+
+        visited[neighbour] = 1
+        stack.append(neighbour)
+
+    return _passages(east, south, cols, rows)
+
+def carve_eller(cols: int, rows: int, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """Eller's algorithm, streaming one lattice row at a time"""
+    east = np.zeros((rows, cols), dtype=bool)
+    south = np.zeros((rows, cols), dtype=bool)
+    if cols == 0 or rows == 0:
+        return east, south
+
+    sets = list(range(cols))  # Set label of each cell in the current row
+    members = {col: [col] for col in range(cols)}
+    next_set = cols
+
+    for row in range(rows):
+        last_row = row == rows - 1
+        joins = rng.random(cols) < 0.5
+
+        # Join adjacent cells that belong to different sets
+        for col in range(cols - 1):
+            left, right = sets[col], sets[col + 1]
+            if left != right and (last_row or joins[col]):
+                east[row, col] = True
+                if len(members[left]) < len(members[right]):
+                    left, right = right, left
+                for other in members.pop(right):
+                    sets[other] = left
+                    members[left].append(other)
+
+        if last_row:
+            break
+
+        # Every set must carry on downwards through at least one cell
+        drops = rng.random(cols) < 0.5
+        for label, cols_in_set in members.items():
+            chosen = [col for col in cols_in_set if drops[col]]
+            if not chosen:
+                chosen = [cols_in_set[int(rng.integers(len(cols_in_set)))]]
+            south[row, chosen] = True
+
+        # Cells that were not dropped into start new sets
+        members = {}
+        for col in range(cols):
+            if south[row, col]:
+                members.setdefault(sets[col], []).append(col)
+            else:
+                sets[col] = next_set
+                members[next_set] = [col]
+                next_set += 1
+
+    return east, south
+
+def carve_wilson(cols: int, rows: int, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """Wilson's algorithm (loop-erased random walks, uniform spanning tree)"""
+    count = cols * rows
+    east = bytearray(count)
+    south = bytearray(count)
+    if count == 0:
+        return _passages(east, south, cols, rows)
+
+    in_maze = bytearray(count)
+    in_maze[int(rng.integers(count))] = 1
+    remaining = count - 1
+    exit_direction = bytearray(count)  # Last direction the walk left each cell
+    steps = rng.integers(0, 4, size=4096).tolist()
+    step_index = 0
+    unvisited = rng.permutation(count).tolist()
+
+    for start in unvisited:
+        if in_maze[start]:
+            continue
+
+        # Random walk until the maze is hit, remembering only the last exit
+        cell = start
+        while not in_maze[cell]:
+            if step_index == len(steps):
+                steps = rng.integers(0, 4, size=4096).tolist()
+                step_index = 0
+            direction = steps[step_index]
+            step_index += 1
+            neighbour = _step(cell, direction, cols, rows)
+            if neighbour < 0:
+                continue
+            exit_direction[cell] = direction
+            cell = neighbour
+
+        # Retrace the loop-erased walk into the maze
+        cell = start
+        while not in_maze[cell]:
+            in_maze[cell] = 1
+            remaining -= 1
+            direction = exit_direction[cell]
+            neighbour = _step(cell, direction, cols, rows)
+            _open(east, south, cell, neighbour, direction)
+            cell = neighbour
+
+        if remaining == 0:
+            break
+
+    return _passages(east, south, cols, rows)
+
+def carve_binary_tree(cols: int, rows: int, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized binary tree: every cell opens either north or east"""
+    east = np.zeros((rows, cols), dtype=bool)
+    south = np.zeros((rows, cols), dtype=bool)
+    if cols == 0 or rows == 0:
+        return east, south
+
+    go_north = rng.random((rows, cols)) < 0.5
+    go_north[0, :] = False     # Top row can only go east
+    go_north[:, -1] = True     # Right column can only go north
+    go_north[0, -1] = False    # Top right corner is the root
+
+    east[:, :-1] = ~go_north[:, :-1]
+    # Opening north from (i, j) is opening south from (i, j - 1)
+    south[:-1, :] = go_north[1:, :]
+    return east, south
+
+def carve_sidewinder(cols: int, rows: int, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized sidewinder: east runs closed by one random opening north"""
+    east = np.zeros((rows, cols), dtype=bool)
+    south = np.zeros((rows, cols), dtype=bool)
+    if cols == 0 or rows == 0:
+        return east, south
+
+    east[:, :-1] = rng.random((rows, cols - 1)) < 0.5
+    east[0, :-1] = True  # Top row is one long corridor
+    if rows == 1:
+        return east, south
+
+    # Label the east runs of every row below the top
+    run_ends = ~east[1:].ravel()  # Last column never continues east
+    run_starts = np.flatnonzero(np.concatenate(([True], run_ends[:-1])))
+    run_lengths = np.diff(np.append(run_starts, run_ends.size))
+
+    # Carve north from one random cell of each run
+    picks = run_starts + (rng.random(run_starts.size) * run_lengths).astype(np.int64)
+    north = np.zeros(run_ends.size, dtype=bool)
+    north[picks] = True
+    south[:-1, :] = north.reshape(rows - 1, cols)
+    return east, south
+
+ALGORITHMS: Dict[str, Callable[[int, int, np.random.Generator], Tuple[np.ndarray, np.ndarray]]] = {
+    'backtracker': carve_backtracker,
+    'eller': carve_eller,
+    'wilson': carve_wilson,
+    'binary_tree': carve_binary_tree,
+    'sidewinder': carve_sidewinder,
+}
+
+def carve_maze(cells: np.ndarray, algorithm: str = 'backtracker',
+               rng: np.random.Generator = None) -> np.ndarray:
+    """Carve a maze into a (height, width) uint8 cell array in place"""
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown maze algorithm '{algorithm}', "
+                         f"expected one of: {', '.join(ALGORITHMS)}")
+    if rng is None:
+        rng = np.random.default_rng()
+
+    height, width = cells.shape
+    cols, rows = lattice_size(width, height)
+    if cols == 0 or rows == 0:
+        return cells
+
+    east, south = ALGORITHMS[algorithm](cols, rows, rng)
+
+    # Lattice cells, then the walls between them that were opened
+    cells[1:2 * rows:2, 1:2 * cols:2] = PATH
+    cells[1:2 * rows:2, 2:2 * cols:2][east[:, :-1]] = PATH
+    cells[2:2 * rows:2, 1:2 * cols:2][south[:-1, :]] = PATH
+    return cells
+
+def _passages(east: bytearray, south: bytearray, cols: int, rows: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert flat passage buffers into (rows, cols) boolean arrays"""
+    east_array = np.frombuffer(bytes(east), dtype=np.uint8).reshape(rows, cols).astype(bool)
+    south_array = np.frombuffer(bytes(south), dtype=np.uint8).reshape(rows, cols).astype(bool)
+    return east_array, south_array
+
+def _step(cell: int, direction: int, cols: int, rows: int) -> int:
+    """Flat index of the neighbour in a direction, or -1 if off the lattice"""
+    if direction == 0:
+        return cell - cols if cell >= cols else -1
+    if direction == 1:
+        return cell + 1 if cell % cols != cols - 1 else -1
+    if direction == 2:
+        return cell + cols if cell < cols * (rows - 1) else -1
+    return cell - 1 if cell % cols != 0 else -1
+
+def _open(east: bytearray, south: bytearray, cell: int, neighbour: int, direction: int):
+    """Open the passage between two adjacent lattice cells"""
+    if direction == 0:
+        south[neighbour] = 1
+    elif direction == 1:
+        east[cell] = 1
+    elif direction == 2:
+        south[cell] = 1
+    else:
+        east[neighbour] = 1
@@ -0,0 +1,202 @@
+"""
+Corridor graph of a maze
+
+Most maze cells are corridor interiors with exactly two open neighbours.
+The corridor graph keeps only junctions and dead ends as nodes and joins
+them with weighted edges (one per corridor), with back-references from
+every corridor cell to its edge so any position can be mapped onto the
+graph. Like the distance fields, it is built over the static topology:
+superposition walls count as open.
+
+Finding the nodes is one vectorized pass over the grid. Corridors are
+traced only when first asked about (by locate, route or corridor), so a
+level pays for the parts of the graph it actually uses rather than for
+the whole maze.
+"""
+
+import heapq
+import numpy as np
+from typing import Dict, Iterator, List, Optional, Tuple
+
+DIRECTIONS = ((0, -1), (1, 0), (0, 1), (-1, 0))  # Up, Right, Down, Left
+
+class CorridorGraph:
+    """Junction/dead-end nodes joined by corridor edges, traced on demand"""
+    def __init__(self, passable: np.ndarray):
+        self.height, self.width = passable.shape
+        self.passable = passable
+        
+        # A node is any open cell without exactly two open neighbours
+        open_cells = np.zeros((self.height + 2, self.width + 2), dtype=bool)
+        open_cells[1:-1, 1:-1] = passable
+        degree = (open_cells[:-2, 1:-1].astype(np.int8) + open_cells[2:, 1:-1] +
+                  open_cells[1:-1, :-2] + open_cells[1:-1, 2:])
+        ys, xs = np.nonzero(passable & (degree != 2))
+        self.node_index = np.full((self.height, self.width), -1, dtype=np.int32)
+        self.node_index[ys, xs] = np.arange(len(xs), dtype=np.int32)
+        self.node_cells: List[Tuple[int, int]] = list(zip(xs.tolist(), ys.tolist()))
+        
+        # Edges and their back-references, filled in as corridors are traced
+        self.edges: List[Tuple[int, int, int]] = []  # (node a, node b, length in steps)
+        self.edge_cells: List[List[Tuple[int, int]]] = []  # Corridor cells from a to b
+        self.node_edges: Dict[Tuple[int, Tuple[int, int]], int] = {}  # (node, direction) -> edge
+        self.cell_edge = np.full((self.height, self.width), -1, dtype=np.int32)
+        self.cell_offset = np.zeros((self.height, self.width), dtype=np.int32)
+    
+    def _is_open(self, grid_x: int, grid_y: int) -> bool:
+        return 0 <= grid_x < self.width and 0 <= grid_y < self.height and bool(self.passable[grid_y, grid_x])
+    
+    def exits(self, grid_x: int, grid_y: int) -> List[Tuple[int, int]]:
+        """Directions out of a cell that lead along the graph"""
+        return [(dx, dy) for dx, dy in DIRECTIONS if self._is_open(grid_x + dx, grid_y + dy)]
+    
+    def _walk(self, grid_x: int, grid_y: int, direction: Tuple[int, int]) -> Tuple[List[Tuple[int, int]], Tuple[int, int]]:
+        """Follow a corridor from a cell until a node (or back to the start)
+        
+        Returns the corridor cells passed and the cell the walk stopped on.
+        """
+        start = previous = (grid_x, grid_y)
+        cell = (grid_x + direction[0], grid_y + direction[1])
+        cells = []
+        while self.node_index[cell[1], cell[0]] < 0 and cell != start:
+            cells.append(cell)
+            for dx, dy in DIRECTIONS:
+                following = (cell[0] + dx, cell[1] + dy)
+                if following != previous and self._is_open(*following):
+                    break
+            previous, cell = cell, following
+        return cells, cell
+    
+    def _edge_from(self, node: int, direction: Tuple[int, int]) -> int:
+        """Edge leaving a node in a direction, tracing its corridor the first time"""
+        edge = self.node_edges.get((node, direction))
+        if edge is not None:
+            return edge
+        
+        cells, end = self._walk(*self.node_cells[node], direction)
+        other = int(self.node_index[end[1], end[0]])
+        edge = len(self.edges)
+        self.edges.append((node, other, len(cells) + 1))
+        self.edge_cells.append(cells)
+        for steps, (cell_x, cell_y) in enumerate(cells, 1):
+            self.cell_edge[cell_y, cell_x] = edge
+            self.cell_offset[cell_y, cell_x] = steps
+        
+        # Register it from both ends so it is traced only once
+        last = cells[-1] if cells else self.node_cells[node]
+        self.node_edges[(node, direction)] = edge
+        self.node_edges[(other, (last[0] - end[0], last[1] - end[1]))] = edge
+        return edge
+    
+    def _add_node(self, grid_x: int, grid_y: int) -> int:
+        """Promote a cell to a node (one cell of a closed loop has to be)"""
+        node = len(self.node_cells)
+        self.node_cells.append((grid_x, grid_y))
+        self.node_index[grid_y, grid_x] = node
+        return node
+    
+    def _edge_through(self, grid_x: int, grid_y: int) -> int:
+        """Edge of a corridor cell, tracing its corridor the first time"""
+        edge = self.cell_edge[grid_y, grid_x]
+        if edge >= 0:
+            return int(edge)
+        direction = self.exits(grid_x, grid_y)[0]
+        cells, end = self._walk(grid_x, grid_y, direction)
+        if end == (grid_x, grid_y):
+            # Closed loop with no junction on it
+            return self._edge_from(self._add_node(grid_x, grid_y), direction)
+        back = cells[-1] if cells else (grid_x, grid_y)
+        return self._edge_from(int(self.node_index[end[1], end[0]]), (back[0] - end[0], back[1] - end[1]))
+    
+    def locate(self, grid_x: int, grid_y: int) -> List[Tuple[int, int]]:
+        """Graph nodes a cell enters through, as (node, steps away)"""
+        if not self._is_open(grid_x, grid_y):
+            return []  # Wall
+        if self.node_index[grid_y, grid_x] < 0:
+            self._edge_through(grid_x, grid_y)  # May promote the cell (closed loop)
+        node = self.node_index[grid_y, grid_x]
+        if node >= 0:
+            return [(int(node), 0)]
+        a, b, length = self.edges[self.cell_edge[grid_y, grid_x]]
+        steps = int(self.cell_offset[grid_y, grid_x])
+        return [(a, steps), (b, length - steps)]
+    
+    def _adjacent(self, node: int) -> Iterator[Tuple[int, int]]:
+        """(other node, steps) for every edge out of a node"""
+        for direction in self.exits(*self.node_cells[node]):
+            a, b, length = self.edges[self._edge_from(node, direction)]
+            yield (b if a == node else a), length
+    
+    def route(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Tuple[int, List[int]]:
+        """Shortest route between two cells as (steps, nodes passed), or (-1, [])"""
+        starts = self.locate(*start)
+        goals: Dict[int, int] = {}  # Node -> steps to the goal (both ends may be one node on a loop)
+        for node, steps in self.locate(*goal):
+            goals[node] = min(steps, goals.get(node, steps))
+        if not starts or not goals:
+            return -1, []
+        
+        # Both cells on the same corridor can be direct
+        best = -1
+        edge = self.cell_edge[start[1], start[0]]
+        if (self.node_index[start[1], start[0]] < 0 and self.node_index[goal[1], goal[0]] < 0 and
+                edge == self.cell_edge[goal[1], goal[0]]):
+            best = abs(int(self.cell_offset[start[1], start[0]]) - int(self.cell_offset[goal[1], goal[0]]))
+        best_route: List[int] = []
+        
+        # Dijkstra over the nodes, tracing corridors as it reaches them
+        distances = {}
+        previous: Dict[int, Optional[int]] = {}
+        for node, steps in starts:
+            if steps < distances.get(node, steps + 1):
+                distances[node] = steps
+                previous[node] = None
+        heap = [(steps, node) for node, steps in distances.items()]
+        heapq.heapify(heap)
+        while heap:
+            steps, node = heapq.heappop(heap)
+            if steps > distances[node] or (best >= 0 and steps >= best):
+                continue
+            if node in goals and (best < 0 or steps + goals[node] < best):
+                best = steps + goals[node]
+                best_route = self._unwind(previous, node)
+            for other, length in self._adjacent(node):
+                total = steps + length
+                if total < distances.get(other, total + 1):
+                    distances[other] = total
+                    previous[other] = node
+                    heapq.heappush(heap, (total, other))
+        return best, best_route
+    
+    @staticmethod
+    def _unwind(previous: Dict[int, Optional[int]], node: int) -> List[int]:
+        """Node chain ending at node, from the Dijkstra predecessors"""
+        nodes = []
+        while node is not None:
+            nodes.append(node)
+            node = previous[node]
+        return nodes[::-1]
+    
+    def corridor(self, grid_x: int, grid_y: int, direction: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Cells from a cell (excluded) along one exit up to the next node (included)"""
+        ahead = (grid_x + direction[0], grid_y + direction[1])
+        if self.node_index[grid_y, grid_x] < 0:
+            self._edge_through(grid_x, grid_y)  # May promote the cell (closed loop)
+        node = self.node_index[grid_y, grid_x]
+        if node >= 0:
+            edge = self._edge_from(int(node), direction)
+            a, b, _ = self.edges[edge]
+            cells = self.edge_cells[edge]
+            first = cells[0] if cells else self.node_cells[b]
+            if node == a and first == ahead:
+                return cells + [self.node_cells[b]]
+            return cells[::-1] + [self.node_cells[a]]
+        
+        # Mid-corridor: edge cells run from a to b, head whichever way direction points
+        edge = self.cell_edge[grid_y, grid_x]
+        a, b, _ = self.edges[edge]
+        cells = self.edge_cells[edge]
+        steps = int(self.cell_offset[grid_y, grid_x])
+        if (cells[steps] if steps < len(cells) else self.node_cells[b]) == ahead:
+            return cells[steps:] + [self.node_cells[b]]
+        return cells[:steps - 1][::-1] + [self.node_cells[a]]
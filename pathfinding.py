@@ -0,0 +1,369 @@
+"""
+Grid pathfinding for ghosts
+
+A heap-based A* over the maze grid with a Manhattan heuristic. Scratch
+buffers (scores, parents) are allocated once per maze and reused: each
+search bumps a search id, and a cell's scores only count if its stamp
+matches the current id, so nothing is cleared between searches.
+
+Walls are read from Maze.solid_cells, so superposition walls block
+exactly while they are solid. Every search expands at most
+max_expansions cells; when the goal isn't reached within that budget the
+path leads to the explored cell closest to it.
+
+PathCache shares found paths between ghosts heading for the same goal,
+and IncrementalPlanner (D* Lite) repairs one ghost's path in place when
+superposition walls flip instead of searching again from scratch.
+"""
+
+import heapq
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
+DEFAULT_MAX_EXPANSIONS = 2000
+INFINITY = float('inf')
+
+class GridPathfinder:
+    """A* over one maze, with reusable scratch buffers and search stats"""
+    def __init__(self, maze, max_expansions: int = DEFAULT_MAX_EXPANSIONS):
+        self.maze = maze
+        self.width = maze.width
+        self.height = maze.height
+        self.max_expansions = max_expansions
+        
+        size = self.width * self.height
+        self.g_score = [0] * size
+        self.parent = [0] * size
+        self.stamp = [0] * size  # Search id that last reached each cell
+        self.search_id = 0
+        
+        # Solid cells as bytes, refreshed when the wall state changes
+        self.blocked = b''
+        self.blocked_epoch = -1
+        
+        # Measurements
+        self.searches = 0
+        self.expansions = 0
+        self.truncated = 0  # Searches that ran out of budget
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.last_expansions = 0
+    
+    def _refresh_blocked(self):
+        """Snapshot the maze's solid cells if a superposition wall flipped"""
+        if self.blocked_epoch != self.maze.wall_epoch or not self.blocked:
+            self.blocked = self.maze.solid_cells.tobytes()
+            self.blocked_epoch = self.maze.wall_epoch
+    
+    def find_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Cells from start (excluded) to goal, or towards it if out of reach"""
+        began = time.perf_counter()
+        self._refresh_blocked()
+        width, height = self.width, self.height
+        blocked = self.blocked
+        g_score, parent, stamp = self.g_score, self.parent, self.stamp
+        self.search_id += 1
+        search_id = self.search_id
+        
+        goal_x, goal_y = goal
+        start_cell = start[1] * width + start[0]
+        goal_cell = goal_y * width + goal_x
+        g_score[start_cell] = 0
+        parent[start_cell] = -1
+        stamp[start_cell] = search_id
+        
+        start_h = abs(start[0] - goal_x) + abs(start[1] - goal_y)
+        best_cell, best_h = start_cell, start_h
+        open_set = [(start_h, start_h, start_cell)]  # (f, h, cell), ties go to the closer cell
+        expansions = 0
+        
+        while open_set and expansions < self.max_expansions:
+            f, h, cell = heapq.heappop(open_set)
+            g = g_score[cell]
+            if f > g + h:
+                continue  # Stale entry, the cell was reached more cheaply since
+            if cell == goal_cell:
+                best_cell = cell
+                break
+            expansions += 1
+            if h < best_h:
+                best_cell, best_h = cell, h
+            
+            x = cell % width
+            y = cell // width
+            g += 1
+            for neighbour, nx, ny in ((cell - width, x, y - 1), (cell + 1, x + 1, y),
+                                      (cell + width, x, y + 1), (cell - 1, x - 1, y)):
+                if not (0 <= nx < width and 0 <= ny < height) or blocked[neighbour]:
+                    continue
+                if stamp[neighbour] == search_id and g_score[neighbour] <= g:
+                    continue
+                stamp[neighbour] = search_id
+                g_score[neighbour] = g
+                parent[neighbour] = cell
+                neighbour_h = abs(nx - goal_x) + abs(ny - goal_y)
+                heapq.heappush(open_set, (g + neighbour_h, neighbour_h, neighbour))
+        else:
+            if expansions >= self.max_expansions:
+                self.truncated += 1
+        
+        # Walk back from the goal (or the closest cell reached)
+        path = []
+        cell = best_cell
+        while cell != start_cell:
+            path.append((cell % width, cell // width))
+            cell = parent[cell]
+        path.reverse()
+        
+        elapsed = time.perf_counter() - began
+        self.searches += 1
+        self.expansions += expansions
+        self.last_expansions = expansions
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+        return path
+    
+    def get_stats(self) -> Dict[str, float]:
+        """Search cost so far (for the debug overlay and benchmarks)"""
+        searches = max(1, self.searches)
+        return {
+            'searches': self.searches,
+            'mean_expansions': self.expansions / searches,
+            'mean_ms': self.total_time * 1000 / searches,
+            'max_ms': self.max_time * 1000,
+            'truncated': self.truncated,
+        }
+
+class PathCache:
+    """LRU of found paths keyed by (start cell, goal cell)
+    
+    A reverse index from cells to entries lets a superposition wall flip
+    drop just the paths that run through the flipped cells. Any cell on a
+    cached path also gets the rest of that path when it asks for the same
+    goal. Partial results (no path, or a search cut off before the goal)
+    are only trusted at the wall epoch they were found in, since a flip
+    anywhere may have opened the way.
+    """
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.entries: OrderedDict = OrderedDict()  # (start, goal) -> (epoch, path)
+        self.cell_entries: Dict[Tuple[int, int], Set[tuple]] = {}  # Cell -> keys of paths through it
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+    
+    def get(self, start: Tuple[int, int], goal: Tuple[int, int],
+            epoch: int) -> Optional[List[Tuple[int, int]]]:
+        """Cached path from start to goal (start excluded) usable at epoch, or None"""
+        key = (start, goal)
+        entry = self.entries.get(key)
+        if entry is not None:
+            if entry[0] == epoch or self._reaches(entry[1], goal):
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self._remove(key)  # Partial and out of date
+        
+        # A path to the same goal running through start: reuse its tail
+        for other in self.cell_entries.get(start, ()):
+            if other[1] == goal:
+                other_epoch, path = self.entries[other]
+                if other_epoch != epoch and not self._reaches(path, goal):
+                    continue
+                self.entries.move_to_end(other)
+                self.hits += 1
+                return path[path.index(start) + 1:]
+        
+        self.misses += 1
+        return None
+    
+    @staticmethod
+    def _reaches(path: List[Tuple[int, int]], goal: Tuple[int, int]) -> bool:
+        """Check if a path is complete (a flip elsewhere can't make it wrong)"""
+        return bool(path) and path[-1] == goal
+    
+    def put(self, start: Tuple[int, int], goal: Tuple[int, int], path: List[Tuple[int, int]], epoch: int):
+        """Cache a path found at the given wall epoch (see get() for how it is used)"""
+        key = (start, goal)
+        if key in self.entries:
+            self._remove(key)
+        self.entries[key] = (epoch, path)
+        for cell in path:
+            self.cell_entries.setdefault(cell, set()).add(key)
+        while len(self.entries) > self.max_entries:
+            self._remove(next(iter(self.entries)))
+    
+    def invalidate_cells(self, cells: List[Tuple[int, int]]):
+        """Drop every path through cells whose wall state changed (a maze wall listener)"""
+        for cell in cells:
+            for key in list(self.cell_entries.get(cell, ())):
+                self._remove(key)
+                self.invalidations += 1
+    
+    def _remove(self, key: tuple):
+        """Remove an entry and its reverse index references"""
+        _, path = self.entries.pop(key)
+        for cell in path:
+            keys = self.cell_entries.get(cell)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.cell_entries[cell]
+    
+    def clear(self):
+        self.entries.clear()
+        self.cell_entries.clear()
+
+class IncrementalPlanner:
+    """D* Lite path to a fixed goal, repaired as walls flip and the start moves
+    
+    Searches backwards from the goal and keeps its g/rhs scores between
+    calls, so after a superposition wall flips only the cells whose
+    distance actually changed are re-expanded. Scores live in dicts, so
+    memory grows with the explored area rather than the maze.
+    """
+    def __init__(self, maze, goal: Tuple[int, int], max_expansions: int = DEFAULT_MAX_EXPANSIONS):
+        self.maze = maze
+        self.width = maze.width
+        self.height = maze.height
+        self.goal = goal
+        self.max_expansions = max_expansions
+        self.solid = maze.solid_cells.ravel()  # Live view, kept current by Maze.update
+        
+        self.goal_cell = goal[1] * self.width + goal[0]
+        self.start_cell = None
+        self.g: Dict[int, float] = {}
+        self.rhs: Dict[int, float] = {self.goal_cell: 0}
+        self.km = 0  # Key modifier as the start moves
+        self.queue = []
+        self.queued: Dict[int, Tuple[float, float]] = {}  # Current key of each queued cell
+        self.pending: Set[Tuple[int, int]] = set()  # Flipped cells not applied yet
+        self._push(self.goal_cell, (self._heuristic(self.goal_cell), 0))
+        
+        # Measurements
+        self.expansions = 0
+        self.last_expansions = 0
+    
+    def _heuristic(self, cell: int) -> int:
+        """Manhattan distance from the current start"""
+        if self.start_cell is None:
+            return 0
+        return (abs(cell % self.width - self.start_cell % self.width) +
+                abs(cell // self.width - self.start_cell // self.width))
+    
+    def _key(self, cell: int) -> Tuple[float, float]:
+        best = min(self.g.get(cell, INFINITY), self.rhs.get(cell, INFINITY))
+        return best + self._heuristic(cell) + self.km, best
+    
+    def _push(self, cell: int, key: Tuple[float, float]):
+        self.queued[cell] = key
+        heapq.heappush(self.queue, (key, cell))
+    
+    def _top(self) -> Optional[Tuple[Tuple[float, float], int]]:
+        """Lowest live queue entry (stale ones are dropped)"""
+        while self.queue:
+            key, cell = self.queue[0]
+            if self.queued.get(cell) == key:
+                return key, cell
+            heapq.heappop(self.queue)
+        return None
+    
+    def _neighbours(self, cell: int) -> List[int]:
+        x, y = cell % self.width, cell // self.width
+        cells = []
+        if y > 0:
+            cells.append(cell - self.width)
+        if x < self.width - 1:
+            cells.append(cell + 1)
+        if y < self.height - 1:
+            cells.append(cell + self.width)
+        if x > 0:
+            cells.append(cell - 1)
+        return cells
+    
+    def _update_cell(self, cell: int):
+        """Recompute a cell's one-step lookahead score and requeue it"""
+        if cell != self.goal_cell:
+            # Stepping into a cell costs 1 unless it is solid
+            best = INFINITY
+            for neighbour in self._neighbours(cell):
+                if not self.solid[neighbour]:
+                    best = min(best, self.g.get(neighbour, INFINITY) + 1)
+            self.rhs[cell] = best
+        self.queued.pop(cell, None)
+        if self.g.get(cell, INFINITY) != self.rhs.get(cell, INFINITY):
+            self._push(cell, self._key(cell))
+    
+    def notify_changed(self, cells: List[Tuple[int, int]]):
+        """Queue flipped cells to be repaired on the next plan (a wall listener)
+        
+        Only cells next to the explored area can change a score; the search
+        reads the live wall state when it first reaches the others.
+        """
+        for x, y in cells:
+            if any(neighbour in self.rhs for neighbour in self._neighbours(y * self.width + x)):
+                self.pending.add((x, y))
+    
+    def _compute(self) -> bool:
+        """Expand cells until the start's score is settled; False if over budget"""
+        start = self.start_cell
+        expansions = 0
+        while True:
+            top = self._top()
+            start_key = self._key(start)
+            if top is None or (top[0] >= start_key and
+                               self.rhs.get(start, INFINITY) == self.g.get(start, INFINITY)):
+                break
+            if expansions >= self.max_expansions:
+                self.last_expansions = expansions
+                self.expansions += expansions
+                return False
+            expansions += 1
+            
+            old_key, cell = top
+            heapq.heappop(self.queue)
+            del self.queued[cell]
+            new_key = self._key(cell)
+            if old_key < new_key:
+                self._push(cell, new_key)
+            elif self.g.get(cell, INFINITY) > self.rhs.get(cell, INFINITY):
+                self.g[cell] = self.rhs[cell]
+                for neighbour in self._neighbours(cell):
+                    self._update_cell(neighbour)
+            else:
+                self.g[cell] = INFINITY
+                self._update_cell(cell)
+                for neighbour in self._neighbours(cell):
+                    self._update_cell(neighbour)
+        
+        self.last_expansions = expansions
+        self.expansions += expansions
+        return True
+    
+    def plan(self, start: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """Cells from start (excluded) to the goal, or None if not reachable (yet)"""
+        start_cell = start[1] * self.width + start[0]
+        if self.start_cell is not None:
+            self.km += self._heuristic(start_cell)  # h(previous start, new start)
+        self.start_cell = start_cell
+        
+        # A flipped cell changes the cost of stepping into it from each neighbour
+        for x, y in self.pending:
+            for neighbour in self._neighbours(y * self.width + x):
+                self._update_cell(neighbour)
+        self.pending.clear()
+        
+        if not self._compute() or self.g.get(start_cell, INFINITY) == INFINITY:
+            return None
+        
+        # Follow the scores downhill to the goal
+        path = []
+        cell = start_cell
+        while cell != self.goal_cell and len(path) <= self.g[start_cell]:
+            cell = min((neighbour for neighbour in self._neighbours(cell) if not self.solid[neighbour]),
+                       key=lambda neighbour: self.g.get(neighbour, INFINITY), default=None)
+            if cell is None or self.g.get(cell, INFINITY) == INFINITY:
+                return None
+            path.append((cell % self.width, cell // self.width))
+        return path
@@ -1,6 +1,7 @@
 import pygame
 import math
 from typing import Tuple
+from camera import to_screen
 
 class QuantumExplorer:
     def __init__(self, x: int, y: int):
@@ -133,8 +134,10 @@ class QuantumExplorer:
             self.radius * 2
         )
     
-    def draw(self, screen):
+    def draw(self, screen, camera=None):
         """Draw the Quantum Explorer with quantum effects"""
+        screen_x, screen_y = to_screen(camera, self.x, self.y)
+        
         # Calculate dynamic colors and sizes
         glow_intensity = (math.sin(self.glow_phase) + 1) * 0.5
         pulse_size = 1 + math.sin(self.pulse_phase) * 0.1
@@ -171,18 +174,18 @@ class QuantumExplorer:
         # Blit glow to screen
         screen.blit(
             glow_surface,
-            (self.x - glow_radius, self.y - glow_radius),
+            (screen_x - glow_radius, screen_y - glow_radius),
             special_flags=pygame.BLEND_ADD
         )
         
         # Draw main body
         main_radius = int(self.radius * pulse_size)
-        pygame.draw.circle(screen, current_color, (int(self.x), int(self.y)), main_radius)
+        pygame.draw.circle(screen, current_color, (int(screen_x), int(screen_y)), main_radius)
         
         # Draw inner core
         core_radius = max(1, int(main_radius * 0.6))
         core_color = tuple(min(255, c + 80) for c in current_color)
-        pygame.draw.circle(screen, core_color, (int(self.x), int(self.y)), core_radius)
+        pygame.draw.circle(screen, core_color, (int(screen_x), int(screen_y)), core_radius)
         
         # Draw quantum state indicators
         if self.has_measurement:
@@ -190,19 +193,19 @@ class QuantumExplorer:
             ring_radius = int(main_radius * 1.5)
             ring_thickness = 2
             measurement_color = (255, 255, 0)  # Yellow for measurement
-            pygame.draw.circle(screen, measurement_color, (int(self.x), int(self.y)), ring_radius, ring_thickness)
+            pygame.draw.circle(screen, measurement_color, (int(screen_x), int(screen_y)), ring_radius, ring_thickness)
             
         # Draw direction indicator
         if abs(self.dx) > 0.1 or abs(self.dy) > 0.1:
             # Small arrow showing movement direction
             arrow_length = 15
-            end_x = self.x + self.dx * arrow_length
-            end_y = self.y + self.dy * arrow_length
+            end_x = screen_x + self.dx * arrow_length
+            end_y = screen_y + self.dy * arrow_length
             
             pygame.draw.line(
                 screen,
                 (255, 255, 255),
-                (int(self.x), int(self.y)),
+                (int(screen_x), int(screen_y)),
                 (int(end_x), int(end_y)),
                 2
             )
@@ -3,7 +3,7 @@ import math
 import random
 from typing import List, Tuple
 from enum import Enum
-from maze import CellType
+from camera import to_screen, in_view
 
 class PowerUpType(Enum):
     SUPERPOSITION = 1
@@ -58,11 +58,13 @@ class PowerUp:
             self.radius * 2
         )
     
-    def draw(self, screen):
+    def draw(self, screen, camera=None):
         """Draw the power-up with quantum effects"""
         if self.collected:
             return
         
+        screen_x, screen_y = to_screen(camera, self.x, self.y)
+        
         # Calculate dynamic effects
         pulse_size = 1 + math.sin(self.pulse_phase) * 0.3
         glow_intensity = (math.sin(self.pulse_phase * 1.2) + 1) * 0.5
@@ -88,36 +90,36 @@ class PowerUp:
         
         screen.blit(
             field_surface,
-            (self.x - field_radius, self.y - field_radius),
+            (screen_x - field_radius, screen_y - field_radius),
             special_flags=pygame.BLEND_ADD
         )
         
         # Draw power-up specific effects
         if self.power_type == PowerUpType.SUPERPOSITION:
-            self._draw_superposition_effect(screen, pulse_size, energy_flow)
+            self._draw_superposition_effect(screen, screen_x, screen_y, pulse_size, energy_flow)
         elif self.power_type == PowerUpType.MEASUREMENT:
-            self._draw_measurement_effect(screen, pulse_size, energy_flow)
+            self._draw_measurement_effect(screen, screen_x, screen_y, pulse_size, energy_flow)
         elif self.power_type == PowerUpType.ENTANGLEMENT:
-            self._draw_entanglement_effect(screen, pulse_size, energy_flow)
+            self._draw_entanglement_effect(screen, screen_x, screen_y, pulse_size, energy_flow)
         
         # Draw main core
         main_radius = int(self.radius * pulse_size)
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), main_radius)
+        pygame.draw.circle(screen, self.color, (int(screen_x), int(screen_y)), main_radius)
         
         # Draw inner energy core
         inner_radius = max(1, int(main_radius * 0.6))
         inner_color = tuple(min(255, c + 80) for c in self.color)
-        pygame.draw.circle(screen, inner_color, (int(self.x), int(self.y)), inner_radius)
+        pygame.draw.circle(screen, inner_color, (int(screen_x), int(screen_y)), inner_radius)
     
-    def _draw_superposition_effect(self, screen, pulse_size: float, energy_flow: float):
+    def _draw_superposition_effect(self, screen, screen_x: float, screen_y: float, pulse_size: float, energy_flow: float):
         """Draw superposition-specific visual effects"""
         # Draw probability wave patterns
         for i in range(3):
             angle = self.rotation + (i * math.pi * 2 / 3)
             wave_radius = 20 + energy_flow * 5
             
-            wave_x = self.x + math.cos(angle) * wave_radius
-            wave_y = self.y + math.sin(angle) * wave_radius
+            wave_x = screen_x + math.cos(angle) * wave_radius
+            wave_y = screen_y + math.sin(angle) * wave_radius
             
             # Flickering probability nodes
             if int(self.energy_phase * 5) % 2:
@@ -127,8 +129,8 @@ class PowerUp:
         for i in range(6):
             angle = i * math.pi / 3
             line_length = 15 * pulse_size
-            end_x = self.x + math.cos(angle) * line_length
-            end_y = self.y + math.sin(angle) * line_length
+            end_x = screen_x + math.cos(angle) * line_length
+            end_y = screen_y + math.sin(angle) * line_length
             
             alpha = int(128 + 127 * abs(energy_flow))
             line_color = (*self.color, alpha)
@@ -139,10 +141,10 @@ class PowerUp:
             
             # Rotate and blit line
             rotated_surf = pygame.transform.rotate(line_surf, math.degrees(angle))
-            rect = rotated_surf.get_rect(center=(int(self.x), int(self.y)))
+            rect = rotated_surf.get_rect(center=(int(screen_x), int(screen_y)))
             screen.blit(rotated_surf, rect)
     
-    def _draw_measurement_effect(self, screen, pulse_size: float, energy_flow: float):
+    def _draw_measurement_effect(self, screen, screen_x: float, screen_y: float, pulse_size: float, energy_flow: float):
         """Draw measurement-specific visual effects"""
         # Draw measurement apparatus (crosshairs)
         crosshair_size = 20 * pulse_size
@@ -150,13 +152,13 @@ class PowerUp:
         
         # Horizontal line
         pygame.draw.line(screen, line_color,
-                        (self.x - crosshair_size, self.y),
-                        (self.x + crosshair_size, self.y), 2)
+                        (screen_x - crosshair_size, screen_y),
+                        (screen_x + crosshair_size, screen_y), 2)
         
         # Vertical line
         pygame.draw.line(screen, line_color,
-                        (self.x, self.y - crosshair_size),
-                        (self.x, self.y + crosshair_size), 2)
+                        (screen_x, screen_y - crosshair_size),
+                        (screen_x, screen_y + crosshair_size), 2)
         
         # Draw measurement probability rings
         for i in range(3):
@@ -167,17 +169,17 @@ class PowerUp:
                 ring_surface = pygame.Surface((ring_radius * 2, ring_radius * 2), pygame.SRCALPHA)
                 pygame.draw.circle(ring_surface, (*self.color, ring_alpha),
                                  (ring_radius, ring_radius), ring_radius, 2)
-                screen.blit(ring_surface, (self.x - ring_radius, self.y - ring_radius))
+                screen.blit(ring_surface, (screen_x - ring_radius, screen_y - ring_radius))
     
-    def _draw_entanglement_effect(self, screen, pulse_size: float, energy_flow: float):
+    def _draw_entanglement_effect(self, screen, screen_x: float, screen_y: float, pulse_size: float, energy_flow: float):
         """Draw entanglement-specific visual effects"""
         # Draw quantum entanglement pairs
         pair_distance = 25 * pulse_size
         
         for i in range(2):
             angle = self.rotation + i * math.pi
-            pair_x = self.x + math.cos(angle) * pair_distance
-            pair_y = self.y + math.sin(angle) * pair_distance
+            pair_x = screen_x + math.cos(angle) * pair_distance
+            pair_y = screen_y + math.sin(angle) * pair_distance
             
             # Draw entangled particle
             particle_radius = int(4 * pulse_size)
@@ -196,10 +198,10 @@ class PowerUp:
                 noise1 = math.sin(self.energy_phase + j) * 3
                 noise2 = math.sin(self.energy_phase + j + 1) * 3
                 
-                x1 = self.x + (pair_x - self.x) * t1 + noise1
-                y1 = self.y + (pair_y - self.y) * t1 + noise1
-                x2 = self.x + (pair_x - self.x) * t2 + noise2
-                y2 = self.y + (pair_y - self.y) * t2 + noise2
+                x1 = screen_x + (pair_x - screen_x) * t1 + noise1
+                y1 = screen_y + (pair_y - screen_y) * t1 + noise1
+                x2 = screen_x + (pair_x - screen_x) * t2 + noise2
+                y2 = screen_y + (pair_y - screen_y) * t2 + noise2
                 
                 pygame.draw.line(screen, connection_color, (int(x1), int(y1)), (int(x2), int(y2)), 1)
         
@@ -210,10 +212,10 @@ class PowerUp:
             inner_radius = 12
             outer_radius = 20 * pulse_size
             
-            inner_x = self.x + math.cos(angle) * inner_radius
-            inner_y = self.y + math.sin(angle) * inner_radius
-            outer_x = self.x + math.cos(angle) * outer_radius
-            outer_y = self.y + math.sin(angle) * outer_radius
+            inner_x = screen_x + math.cos(angle) * inner_radius
+            inner_y = screen_y + math.sin(angle) * inner_radius
+            outer_x = screen_x + math.cos(angle) * outer_radius
+            outer_y = screen_y + math.sin(angle) * outer_radius
             
             field_alpha = int(80 + 80 * abs(energy_flow))
             field_color = (*self.color, field_alpha)
@@ -252,17 +254,13 @@ class PowerUpManager:
         if len(self.powerups) >= 3:
             return
         
-        # Get random path position
-        path_positions = []
-        for y in range(maze.height):
-            for x in range(maze.width):
-                if maze.grid[y][x] == CellType.PATH:  # Check for PATH cells
-                    center_x = x * maze.cell_size + maze.cell_size // 2
-                    center_y = y * maze.cell_size + maze.cell_size // 2
-                    path_positions.append((center_x, center_y))
+        # Get random path position not already holding a power-up
+        occupied = {(int(p.x // maze.cell_size), int(p.y // maze.cell_size))
+                    for p in self.powerups}
+        position = maze.get_random_free_position(occupied)
         
-        if path_positions:
-            x, y = random.choice(path_positions)
+        if position:
+            x, y = position
             power_type = random.choice(list(PowerUpType))
             self.powerups.append(PowerUp(x, y, power_type))
     
@@ -294,11 +292,11 @@ class PowerUpManager:
                 p.power_type == PowerUpType.ENTANGLEMENT and 
                 not p.collected]
     
-    def draw(self, screen):
-        """Draw all active power-ups"""
+    def draw(self, screen, camera=None):
+        """Draw all active power-ups in view"""
         for powerup in self.powerups:
-            if not powerup.collected:
-                powerup.draw(screen)
+            if not powerup.collected and in_view(camera, powerup.x, powerup.y, 40):
+                powerup.draw(screen, camera)
     
     def clear(self):
         """Clear all power-ups"""
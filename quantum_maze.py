@@ -4,11 +4,12 @@ import math
 from enum import Enum
 from typing import List, Tuple, Optional
 from player import QuantumExplorer
-from maze import Maze
+from level_pipeline import LevelPipeline, LevelPlan, MazeSpec
 from qubits import QubitManager
 from enemies import EnemyManager
 from powerups import PowerUpManager
 from tunnels import TunnelManager
+from camera import Camera
 from hud import RetroHUD
 from simple_separated_hud import SimpleSeparatedHUD
 from stats import GameStats
@@ -59,13 +60,20 @@ class QuantumMaze:
         # Game objects
         self.player = None
         self.maze = None
+        self.camera = None
         self.qubit_manager = QubitManager()
-        self.enemy_manager = EnemyManager()
+        self.enemy_manager = EnemyManager(config.GHOST_PLANNER)
         self.powerup_manager = PowerUpManager()
         self.tunnel_manager = TunnelManager()
         self.hud = SimpleSeparatedHUD(SCREEN_WIDTH, SCREEN_HEIGHT)
         self.stats = GameStats()
         self.quantum_notation = QuantumNotationDisplay(SCREEN_WIDTH, SCREEN_HEIGHT)
+        
+        # Builds the next level in the background while this one is played
+        self.level_pipeline = LevelPipeline(self.hud_adjusted_maze_spec,
+                                            (SCREEN_WIDTH, self.hud.game_area_height),
+                                            config.MAZE_CACHE_DIR)  # Seeded levels only
+        self.level_pipeline.prepare(1)  # Ready by the time the menu is left
         self.dt = 0
         
         # Level transition
@@ -80,11 +88,18 @@ class QuantumMaze:
         # Start menu music
         audio_manager.play_music('menu')
         
-    def create_hud_adjusted_maze(self):
-        """Create a maze with dimensions adjusted for HUD space"""
+    def hud_adjusted_maze_spec(self, level: Optional[int] = None) -> MazeSpec:
+        """Maze parameters for a level, with the height adjusted for HUD space"""
+        if level is None:
+            level = self.level
         available_height = self.hud.game_area_height
-        adjusted_maze_height = min(config.MAZE_HEIGHT, available_height // config.CELL_SIZE)
-        return Maze(config.MAZE_WIDTH, adjusted_maze_height, config.CELL_SIZE)
+        if config.MAZE_HEIGHT * config.CELL_SIZE > SCREEN_HEIGHT:
+            # Larger than the screen anyway, the camera scrolls over it
+            adjusted_maze_height = config.MAZE_HEIGHT
+        else:
+            adjusted_maze_height = min(config.MAZE_HEIGHT, available_height // config.CELL_SIZE)
+        seed = None if config.MAZE_SEED is None else config.MAZE_SEED + level - 1
+        return config.MAZE_WIDTH, adjusted_maze_height, seed, config.MAZE_ALGORITHM, config.CELL_SIZE
         
     def handle_events(self):
         """Handle all game events"""
@@ -135,35 +150,19 @@ class QuantumMaze:
         self.stats.reset()
         
         # Create maze using HUD-adjusted dimensions to prevent overlap
-        self.maze = self.create_hud_adjusted_maze()
-        
-        # Initialize player at a random path position
-        start_x, start_y = self.maze.get_random_path_position()
-        self.player = QuantumExplorer(start_x, start_y)
-        
-        # Generate qubits with entangled pairs
-        qubit_count = config.get_qubit_count(self.level)
-        self.qubit_manager.generate_qubits(self.maze, qubit_count, config.ENTANGLED_PAIRS_PER_LEVEL)
-        
-        # Spawn enemies
-        enemy_count = config.get_enemy_count(self.level)
-        self.enemy_manager.spawn_ghosts(self.maze, enemy_count)
+        self.player = None  # Fresh player for a new game
+        self.apply_level(self.level_pipeline.take(self.level))
         
-        # Clear power-ups and tunnels
-        self.powerup_manager.clear()
-        self.tunnel_manager.clear()
-        
-        # Create quantum tunnels
-        self.tunnel_manager.create_tunnel_pair(self.maze, 0)
+        # Camera over the game area, following the player
+        self.camera = Camera(SCREEN_WIDTH, self.hud.game_area_height,
+                             self.maze.width * self.maze.cell_size,
+                             self.maze.height * self.maze.cell_size)
+        self.camera.follow(self.player.x, self.player.y)
         
         # Start game music
         audio_manager.stop_music()
         audio_manager.play_music('game')
         
-    def reset_game(self):
-        """Reset game to menu state"""
-        self.game_state = GameState.MENU
-        
     def update(self):
         """Update game logic based on current state"""
         # Update HUD animations
@@ -189,13 +188,14 @@ class QuantumMaze:
             
             # Update player with maze collision
             self.player.update(self.dt, self.maze)
+            self.camera.follow(self.player.x, self.player.y)
             
             # Update qubits
             self.qubit_manager.update(self.dt)
             
-            # Update enemies with qubits for guardian AI
-            entangled_qubits = self.qubit_manager.get_entangled_qubits()
-            self.enemy_manager.update(self.dt, self.maze, self.player, entangled_qubits)
+            # Update enemies with the entangled qubits for guardian AI
+            self.enemy_manager.update(self.dt, self.maze, self.player,
+                                      qubit_index=self.qubit_manager.entangled_index)
             
             # Update power-ups
             self.powerup_manager.update(self.dt, self.maze)
@@ -319,27 +319,38 @@ class QuantumMaze:
         # Play level complete sound
         audio_manager.play_sound('level_complete')
         
-        # Create new maze with HUD-adjusted dimensions (same as start_new_game)
-        self.maze = self.create_hud_adjusted_maze()
+        # Swap in the level prepared in the background
+        self.apply_level(self.level_pipeline.take(self.level))
+        self.camera.set_world_size(self.maze.width * self.maze.cell_size,
+                                   self.maze.height * self.maze.cell_size)
+        self.camera.follow(self.player.x, self.player.y)
+        
+    def apply_level(self, plan: LevelPlan):
+        """Install a prepared level, then start preparing the one after it"""
+        self.maze = plan.maze
         
-        # Reset player position
-        start_x, start_y = self.maze.get_random_path_position()
-        self.player.x, self.player.y = start_x, start_y
+        # Player at the planned start position
+        start_x, start_y = plan.start_position
+        if self.player is None:
+            self.player = QuantumExplorer(start_x, start_y)
+        else:
+            self.player.x, self.player.y = start_x, start_y
         
-        # Generate more qubits for higher levels
-        qubit_count = config.get_qubit_count(self.level)
-        self.qubit_manager.generate_qubits(self.maze, qubit_count, config.ENTANGLED_PAIRS_PER_LEVEL)
+        # Qubits with entangled pairs
+        self.qubit_manager.generate_qubits(self.maze, len(plan.qubit_positions), plan.entangled_pairs,
+                                           plan.qubit_positions)
         
-        # Spawn more enemies for higher levels
-        enemy_count = config.get_enemy_count(self.level)
-        self.enemy_manager.spawn_ghosts(self.maze, enemy_count)
+        # Enemies, away from the player start
+        self.enemy_manager.spawn_ghosts(self.maze, len(plan.ghost_positions), (start_x, start_y),
+                                        plan.ghost_positions)
         
-        # Clear power-ups and tunnels for new level
+        # Clear power-ups and tunnels, then create the quantum tunnels
         self.powerup_manager.clear()
         self.tunnel_manager.clear()
+        if plan.tunnel_positions is not None:
+            self.tunnel_manager.create_tunnel_pair(self.maze, 0, plan.tunnel_positions)
         
-        # Create new quantum tunnels
-        self.tunnel_manager.create_tunnel_pair(self.maze, 0)
+        self.level_pipeline.prepare(plan.level + 1)
         
     def player_hit(self):
         """Handle player being hit by enemy"""
@@ -370,17 +381,22 @@ class QuantumMaze:
         game_area_rect = pygame.Rect(0, 0, SCREEN_WIDTH, self.hud.game_area_height)
         self.screen.set_clip(game_area_rect)
         
-        # Draw game content within clipped area
+        # Draw game content within clipped area, through the camera
         if self.maze:
-            self.maze.draw(self.screen)
+            self.maze.draw(self.screen, self.camera)
         
-        self.tunnel_manager.draw(self.screen)
-        self.qubit_manager.draw(self.screen)
-        self.powerup_manager.draw(self.screen)
-        self.enemy_manager.draw(self.screen)
+        self.tunnel_manager.draw(self.screen, self.camera)
+        self.qubit_manager.draw(self.screen, self.camera)
+        self.powerup_manager.draw(self.screen, self.camera)
+        self.enemy_manager.draw(self.screen, self.camera)
         
         if self.player:
-            self.player.draw(self.screen)
+            self.player.draw(self.screen, self.camera)
+        
+        if config.SHOW_COLLISION_BOXES and self.maze:
+            self.draw_collision_boxes()
+        if config.SHOW_PATHFINDING and self.maze:
+            self.draw_ghost_paths()
         
         # Reset clipping for HUD drawing
         self.screen.set_clip(None)
@@ -440,7 +456,38 @@ class QuantumMaze:
     def draw_pause_screen(self):
         """Draw pause overlay"""
         self.hud.draw_pause_overlay(self.screen)
-        
+    
+    def draw_collision_boxes(self):
+        """Debug overlay of the merged collision rectangles in view"""
+        has_superposition = self.player.has_superposition if self.player else False
+        rects = self.maze.get_collision_rects(has_superposition)
+        view = self.camera.get_view_rect() if self.camera else self.screen.get_rect()
+        offset_x, offset_y = view.topleft
+        for index in view.collidelistall(rects):
+            pygame.draw.rect(self.screen, (255, 0, 0), rects[index].move(-offset_x, -offset_y), 1)
+        
+    def draw_ghost_paths(self):
+        """Debug overlay of every ghost's current path, the A* search cost and AI frame time"""
+        for ghost in self.enemy_manager.ghosts:
+            if ghost.is_captured or len(ghost.path) < 2:
+                continue
+            points = [self.camera.world_to_screen(x, y) if self.camera else (x, y) for x, y in ghost.path]
+            pygame.draw.lines(self.screen, ghost.base_color, False, points, 1)
+        
+        stats = self.maze.pathfinder.get_stats()
+        cache = self.enemy_manager.path_cache
+        text = self.small_font.render(
+            f"A*: {stats['searches']} searches, {stats['mean_expansions']:.0f} cells, "
+            f"{stats['mean_ms']:.2f} ms avg, {stats['max_ms']:.2f} ms max, "
+            f"cache {cache.hits}/{cache.hits + cache.misses} hits", True, WHITE)
+        self.screen.blit(text, (10, 10))
+        
+        scheduler = self.enemy_manager.scheduler
+        text = self.small_font.render(
+            f"AI: {scheduler.last_ms:.2f} ms/frame ({scheduler.budget_ms:.1f} budget), "
+            f"{scheduler.max_ms:.2f} ms max, {scheduler.deferred} deferred", True, WHITE)
+        self.screen.blit(text, (10, 10 + text.get_height()))
+    
     def draw_game_over(self):
         """Draw game over screen"""
         # Draw the game state first (faded)
@@ -476,12 +523,14 @@ class QuantumMaze:
     def reset_game(self):
         """Reset game to menu state"""
         self.game_state = GameState.MENU
+        self.level_pipeline.prepare(1)  # Level 1 is ready by the time a new game starts
         # Start menu music
         audio_manager.stop_music()
         audio_manager.play_music('menu')
         
     def cleanup(self):
         """Clean up resources"""
+        self.level_pipeline.shutdown()
         audio_manager.cleanup()
         
     def run(self):
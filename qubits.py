@@ -2,7 +2,9 @@ import pygame
 import math
 import random
 from typing import List, Tuple, Optional
-from maze import CellType
+from camera import to_screen, in_view
+from spatial_hash import SpatialHash
+import config
 
 class Qubit:
     def __init__(self, x: int, y: int, is_entangled: bool = False):
@@ -61,10 +63,12 @@ class Qubit:
             self.radius * 2
         )
     
-    def draw(self, screen):
+    def draw(self, screen, camera=None):
         """Draw the qubit with quantum effects"""
         if self.collected:
             return
+        
+        screen_x, screen_y = to_screen(camera, self.x, self.y)
             
         # Calculate dynamic effects
         pulse_size = 1 + math.sin(self.pulse_phase) * 0.2
@@ -72,14 +76,14 @@ class Qubit:
         
         # Draw entanglement connection first (so it appears behind qubits)
         if self.is_entangled and self.entangled_partner and not self.entangled_partner.collected:
-            self._draw_entanglement_connection(screen)
+            self._draw_entanglement_connection(screen, camera)
         
         # Draw orbital particles
         for i in range(3):
             angle = self.orbit_phase + (i * math.pi * 2 / 3)
             orbit_radius = 15
-            orbit_x = self.x + math.cos(angle) * orbit_radius
-            orbit_y = self.y + math.sin(angle) * orbit_radius
+            orbit_x = screen_x + math.cos(angle) * orbit_radius
+            orbit_y = screen_y + math.sin(angle) * orbit_radius
             
             particle_alpha = int(100 + 100 * math.sin(angle + self.orbit_phase))
             particle_color = (*self.orbit_color, particle_alpha)
@@ -109,52 +113,54 @@ class Qubit:
         
         screen.blit(
             glow_surface,
-            (self.x - glow_radius, self.y - glow_radius),
+            (screen_x - glow_radius, screen_y - glow_radius),
             special_flags=pygame.BLEND_ADD
         )
         
         # Draw main qubit body
         main_radius = int(self.radius * pulse_size)
-        pygame.draw.circle(screen, self.core_color, (int(self.x), int(self.y)), main_radius)
+        pygame.draw.circle(screen, self.core_color, (int(screen_x), int(screen_y)), main_radius)
         
         # Draw inner quantum state visualization
         inner_radius = max(1, int(main_radius * 0.6))
         
         # Rotating quantum state indicator
-        state_x = self.x + math.cos(self.rotation) * inner_radius * 0.5
-        state_y = self.y + math.sin(self.rotation) * inner_radius * 0.5
+        state_x = screen_x + math.cos(self.rotation) * inner_radius * 0.5
+        state_y = screen_y + math.sin(self.rotation) * inner_radius * 0.5
         pygame.draw.circle(screen, (255, 255, 255), (int(state_x), int(state_y)), 2)
         
         # Draw quantum interference pattern
         pattern_lines = 6 if self.is_entangled else 4
         for i in range(pattern_lines):
             angle = self.rotation + (i * math.pi / pattern_lines)
-            line_end_x = self.x + math.cos(angle) * main_radius * 0.8
-            line_end_y = self.y + math.sin(angle) * main_radius * 0.8
+            line_end_x = screen_x + math.cos(angle) * main_radius * 0.8
+            line_end_y = screen_y + math.sin(angle) * main_radius * 0.8
             
             line_color = (255, 255, 200) if not self.is_entangled else (255, 200, 255)
             pygame.draw.line(
                 screen,
                 line_color,
-                (int(self.x), int(self.y)),
+                (int(screen_x), int(screen_y)),
                 (int(line_end_x), int(line_end_y)),
                 1
             )
     
-    def _draw_entanglement_connection(self, screen):
+    def _draw_entanglement_connection(self, screen, camera=None):
         """Draw the quantum entanglement connection"""
         if not self.entangled_partner:
             return
         
         partner = self.entangled_partner
+        screen_x, screen_y = to_screen(camera, self.x, self.y)
+        partner_x, partner_y = to_screen(camera, partner.x, partner.y)
         
         # Draw pulsating connection line
         connection_alpha = int(100 + 100 * math.sin(self.pulse_phase))
         connection_color = (255, 0, 255, connection_alpha)
         
         # Create connection surface
-        dx = partner.x - self.x
-        dy = partner.y - self.y
+        dx = partner_x - screen_x
+        dy = partner_y - screen_y
         distance = math.sqrt(dx*dx + dy*dy)
         
         if distance > 0:
@@ -166,10 +172,10 @@ class Qubit:
                 perp_x = -dy / distance * offset
                 perp_y = dx / distance * offset
                 
-                start_x = self.x + perp_x
-                start_y = self.y + perp_y
-                end_x = partner.x + perp_x
-                end_y = partner.y + perp_y
+                start_x = screen_x + perp_x
+                start_y = screen_y + perp_y
+                end_x = partner_x + perp_x
+                end_y = partner_y + perp_y
                 
                 # Draw wavy line
                 segments = 10
@@ -201,8 +207,8 @@ class Qubit:
         for i in range(particle_count):
             t = (i / particle_count + self.pulse_phase * 0.1) % 1.0
             
-            particle_x = self.x + (partner.x - self.x) * t
-            particle_y = self.y + (partner.y - self.y) * t
+            particle_x = screen_x + (partner_x - screen_x) * t
+            particle_y = screen_y + (partner_y - screen_y) * t
             
             particle_alpha = int(150 * math.sin(t * math.pi))
             if particle_alpha > 50:
@@ -220,37 +226,43 @@ class QubitManager:
         self.entanglement_timer = 0
         self.entanglement_duration = 10.0  # 10 seconds to collect partner
         self.active_entanglement = None  # Currently active entanglement bonus
+        self.entangled_index = SpatialHash(config.CELL_SIZE)  # Uncollected entangled qubits, for guardians
         
-    def generate_qubits(self, maze, count: int = 50, entangled_pairs: int = 2):
-        """Generate qubits in the maze paths"""
-        self.qubits.clear()
-        self.entangled_pairs.clear()
-        self.total_qubits = count
-        self.collected_qubits = 0
-        self.active_entanglement = None
+    @staticmethod
+    def plan_positions(maze, count: int = 50, entangled_pairs: int = 2) -> Tuple[List[Tuple[int, int]], int]:
+        """Pick qubit positions without touching any game state
         
+        Returns the positions and how many entangled pairs fit in them.
+        """
         # Get all path positions
-        path_positions = []
-        for y in range(maze.height):
-            for x in range(maze.width):
-                if maze.grid[y][x] == CellType.PATH:
-                    center_x = x * maze.cell_size + maze.cell_size // 2
-                    center_y = y * maze.cell_size + maze.cell_size // 2
-                    path_positions.append((center_x, center_y))
-        
-        if len(path_positions) < count:
-            count = len(path_positions)
-            self.total_qubits = count
+        path_count = maze.get_path_cell_count()
+        if path_count < count:
+            count = path_count
         
         # Check if we have enough positions for entangled pairs
         needed_positions = count
-        if needed_positions > len(path_positions):
+        if needed_positions > path_count:
             # Reduce entangled pairs if necessary
-            max_entangled_pairs = (len(path_positions) - (count - entangled_pairs * 2)) // 2
+            max_entangled_pairs = (path_count - (count - entangled_pairs * 2)) // 2
             entangled_pairs = max(0, min(entangled_pairs, max_entangled_pairs))
         
         # Select positions for qubits
-        selected_positions = random.sample(path_positions, count)
+        return maze.sample_path_positions(count), entangled_pairs
+    
+    def generate_qubits(self, maze, count: int = 50, entangled_pairs: int = 2,
+                        positions: Optional[List[Tuple[int, int]]] = None):
+        """Generate qubits in the maze paths (at pre-planned positions if given)"""
+        self.qubits.clear()
+        self.entangled_pairs.clear()
+        self.active_entanglement = None
+        self.entangled_index = SpatialHash(maze.cell_size)
+        
+        if positions is None:
+            positions, entangled_pairs = self.plan_positions(maze, count, entangled_pairs)
+        selected_positions = positions
+        count = len(selected_positions)
+        self.total_qubits = count
+        self.collected_qubits = 0
         
         # Create regular qubits
         regular_count = count - (entangled_pairs * 2)
@@ -275,6 +287,8 @@ class QubitManager:
                 # Add to lists
                 self.qubits.extend([qubit1, qubit2])
                 self.entangled_pairs.append((qubit1, qubit2))
+                self.entangled_index.insert(qubit1, x1, y1)
+                self.entangled_index.insert(qubit2, x2, y2)
     
     def update(self, dt: float):
         """Update all qubits and entanglement timers"""
@@ -297,6 +311,7 @@ class QubitManager:
             if not qubit.collected and player_rect.colliderect(qubit.get_rect()):
                 qubit.collected = True
                 self.collected_qubits += 1
+                self.entangled_index.remove(qubit)
                 
                 if qubit.is_entangled and qubit.entangled_partner:
                     # Check if this starts or completes an entanglement
@@ -330,11 +345,11 @@ class QubitManager:
                 
         return points_earned, entanglement_activated
     
-    def draw(self, screen):
-        """Draw all uncollected qubits"""
+    def draw(self, screen, camera=None):
+        """Draw all uncollected qubits in view"""
         for qubit in self.qubits:
-            if not qubit.collected:
-                qubit.draw(screen)
+            if not qubit.collected and in_view(camera, qubit.x, qubit.y, 30):
+                qubit.draw(screen, camera)
     
     def draw_entanglement_timer(self, screen, font):
         """Draw entanglement timer if active"""
@@ -0,0 +1,87 @@
+"""
+Uniform-grid spatial hash
+
+Items with x/y world positions are bucketed by grid cell (one maze cell
+per bucket), so "what is near this point" only looks at the buckets the
+query covers instead of every item. Moving items are re-bucketed by
+their owner whenever they cross into another cell.
+"""
+
+import pygame
+from typing import Dict, Tuple
+
+class SpatialHash:
+    """Items bucketed by grid cell, with radius and rectangle queries"""
+    def __init__(self, cell_size: int):
+        self.cell_size = cell_size
+        self.buckets: Dict[Tuple[int, int], list] = {}
+        self.cells: Dict[object, Tuple[int, int]] = {}  # Item -> bucket it is in
+    
+    def __len__(self) -> int:
+        return len(self.cells)
+    
+    def cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        """Bucket a world position falls in"""
+        return int(x // self.cell_size), int(y // self.cell_size)
+    
+    def insert(self, item, x: float, y: float):
+        """Add an item at a position, or move it there if already present"""
+        cell = self.cell_of(x, y)
+        old_cell = self.cells.get(item)
+        if old_cell == cell:
+            return
+        if old_cell is not None:
+            self._unlink(item, old_cell)
+        self.buckets.setdefault(cell, []).append(item)
+        self.cells[item] = cell
+    
+    def remove(self, item):
+        """Drop an item (no-op if it isn't indexed)"""
+        cell = self.cells.pop(item, None)
+        if cell is not None:
+            self._unlink(item, cell)
+    
+    def _unlink(self, item, cell: Tuple[int, int]):
+        bucket = self.buckets[cell]
+        bucket.remove(item)
+        if not bucket:
+            del self.buckets[cell]
+    
+    def clear(self):
+        self.buckets.clear()
+        self.cells.clear()
+    
+    def _gather(self, left: float, top: float, right: float, bottom: float) -> list:
+        """Items in every bucket overlapping a world-space box"""
+        min_x, min_y = self.cell_of(left, top)
+        max_x, max_y = self.cell_of(right, bottom)
+        found = []
+        # Few items means few buckets: walk whichever side is smaller
+        if len(self.buckets) < (max_x - min_x + 1) * (max_y - min_y + 1):
+            for (cell_x, cell_y), bucket in self.buckets.items():
+                if min_x <= cell_x <= max_x and min_y <= cell_y <= max_y:
+                    found.extend(bucket)
+        else:
+            for cell_y in range(min_y, max_y + 1):
+                for cell_x in range(min_x, max_x + 1):
+                    bucket = self.buckets.get((cell_x, cell_y))
+                    if bucket:
+                        found.extend(bucket)
+        return found
+    
+    def query_radius(self, x: float, y: float, radius: float) -> list:
+        """Items whose position is within radius of (x, y)"""
+        radius_squared = radius * radius
+        return [item for item in self._gather(x - radius, y - radius, x + radius, y + radius)
+                if (item.x - x) ** 2 + (item.y - y) ** 2 <= radius_squared]
+    
+    def query_rect(self, rect: pygame.Rect, padding: float = 0) -> list:
+        """Items whose position is inside rect grown by padding on every side
+        
+        Pass the items' own radius as padding to find everything whose
+        extent could overlap the rect.
+        """
+        left, top = rect.left - padding, rect.top - padding
+        right, bottom = rect.right + padding, rect.bottom + padding
+        return [item for item in self._gather(left, top, right, bottom)
+                if left <= item.x <= right and top <= item.y <= bottom]
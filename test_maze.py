@@ -0,0 +1,78 @@
+"""
+Maze generation, level format and collision mesh checks
+
+Run with: python -m pytest -q
+"""
+
+from collections import deque
+
+import numpy as np
+import pytest
+
+from maze import CellType, Maze
+from maze_generation import ALGORITHMS, carve_maze
+
+def reachable(passable: np.ndarray, start) -> int:
+    """Number of passable cells reachable from start (4-connected BFS)"""
+    height, width = passable.shape
+    seen = np.zeros(passable.shape, dtype=bool)
+    seen[start[1], start[0]] = True
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= nx < width and 0 <= ny < height and passable[ny, nx] and not seen[ny, nx]:
+                seen[ny, nx] = True
+                queue.append((nx, ny))
+    return int(seen.sum())
+
+@pytest.mark.parametrize('algorithm', sorted(ALGORITHMS))
+@pytest.mark.parametrize('width, height', [(21, 21), (41, 17), (30, 24)])
+def test_generators_carve_perfect_mazes(algorithm, width, height):
+    cells = np.zeros((height, width), dtype=np.uint8)
+    carve_maze(cells, algorithm, np.random.default_rng(7))
+    path = cells == CellType.PATH.value
+    
+    # Every lattice cell is carved, and the borders stay solid
+    assert path[1:height - 1:2, 1:width - 1:2][:(height - 1) // 2, :(width - 1) // 2].all()
+    assert not path[0].any() and not path[:, 0].any()
+    
+    # Connected, and a tree: one fewer adjacency than path cells
+    count = int(path.sum())
+    links = int((path[:, 1:] & path[:, :-1]).sum() + (path[1:] & path[:-1]).sum())
+    assert reachable(path, (1, 1)) == count
+    assert links == count - 1
+
+def test_unknown_algorithm_is_rejected():
+    with pytest.raises(ValueError):
+        carve_maze(np.zeros((11, 11), dtype=np.uint8), 'spiral')
+
+@pytest.mark.parametrize('algorithm', sorted(ALGORITHMS))
+def test_level_format_round_trip(algorithm):
+    maze = Maze(41, 31, algorithm=algorithm, seed=5)
+    maze.update(0.7)  # Phases move on, but the format stores the initial state
+    data = maze.to_bytes()
+    loaded = Maze.from_bytes(data)
+    
+    assert (loaded.width, loaded.height, loaded.seed, loaded.algorithm) == (41, 31, 5, algorithm)
+    assert np.array_equal(loaded.cells, maze.cells)
+    assert np.array_equal(loaded.wall_index, maze.wall_index)
+    for name in ('xs', 'ys', 'phase0', 'frequency'):
+        assert np.array_equal(getattr(loaded.wall_field, name), getattr(maze.wall_field, name))
+    assert loaded.to_bytes() == data
+
+def test_level_format_rejects_other_data():
+    with pytest.raises(ValueError):
+        Maze.from_bytes(b'\0' * 64)
+
+@pytest.mark.parametrize('seed', range(4))
+def test_collision_mesh_covers_each_wall_once(seed):
+    maze = Maze(37, 29, cell_size=8, seed=seed)
+    coverage = np.zeros(maze.cells.shape, dtype=np.int32)
+    for rect in maze.get_collision_rects(player_has_superposition=True):
+        coverage[rect.top // 8:rect.bottom // 8, rect.left // 8:rect.right // 8] += 1
+    assert np.array_equal(coverage, maze.wall_mask().astype(np.int32))
+    
+    # Solid superposition walls are added on top, one cell each
+    solid = maze.get_collision_rects()[len(maze.static_collision_rects):]
+    assert len(solid) == int(maze.wall_field.is_solid.sum())
@@ -0,0 +1,115 @@
+"""
+Ghost pathfinding checks: A*, D* Lite path repair and the shared path cache
+
+Run with: python -m pytest -q
+"""
+
+from collections import deque
+
+import numpy as np
+import pytest
+
+from maze import Maze
+from pathfinding import GridPathfinder, IncrementalPlanner, PathCache
+
+UNLIMITED = 10 ** 6
+
+def bfs_length(maze: Maze, start, goal) -> int:
+    """Shortest step count from start to goal over cells that are open right now"""
+    passable = ~maze.solid_cells
+    distance = {start: 0}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        if (x, y) == goal:
+            return distance[goal]
+        for cell in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if cell not in distance and passable[cell[1], cell[0]]:
+                distance[cell] = distance[(x, y)] + 1
+                queue.append(cell)
+    return -1
+
+def assert_walkable(maze: Maze, start, path):
+    """Each step moves to an adjacent open cell"""
+    previous = start
+    for x, y in path:
+        assert abs(x - previous[0]) + abs(y - previous[1]) == 1
+        assert not maze.solid_cells[y, x]
+        previous = (x, y)
+
+def path_pairs(maze: Maze, count: int, seed: int):
+    """Random distinct (start, goal) path cells"""
+    xs, ys = maze.path_xs.tolist(), maze.path_ys.tolist()
+    rng = np.random.default_rng(seed)
+    for _ in range(count):
+        first, second = rng.choice(len(xs), size=2, replace=False)
+        yield (xs[first], ys[first]), (xs[second], ys[second])
+
+@pytest.mark.parametrize('algorithm', ['backtracker', 'wilson', 'binary_tree'])
+def test_astar_paths_are_shortest(algorithm):
+    maze = Maze(61, 45, algorithm=algorithm, seed=11)
+    maze.update(1.3)
+    pathfinder = GridPathfinder(maze, max_expansions=UNLIMITED)
+    for start, goal in path_pairs(maze, 40, seed=1):
+        path = pathfinder.find_path(start, goal)
+        assert path[-1] == goal
+        assert len(path) == bfs_length(maze, start, goal)
+        assert_walkable(maze, start, path)
+
+def test_astar_falls_back_towards_the_goal_over_budget():
+    maze = Maze(61, 61, seed=3)
+    start, goal = (1, 1), (59, 59)
+    path = GridPathfinder(maze, max_expansions=50).find_path(start, goal)
+    assert path and path[-1] != goal
+    assert_walkable(maze, start, path)
+
+@pytest.mark.parametrize('seed', range(3))
+def test_dstar_lite_matches_astar_after_wall_flips(seed):
+    maze = Maze(51, 51, seed=seed)
+    start, goal = next(path_pairs(maze, 1, seed))
+    planner = IncrementalPlanner(maze, goal, max_expansions=UNLIMITED)
+    maze.add_wall_listener(planner.notify_changed)
+    pathfinder = GridPathfinder(maze, max_expansions=UNLIMITED)
+    
+    flips = 0
+    for _ in range(30):
+        maze.update(0.25)
+        flips += len(maze.changed_walls)
+        path = planner.plan(start)
+        assert path is not None and path[-1] == goal
+        assert len(path) == len(pathfinder.find_path(start, goal))
+        assert_walkable(maze, start, path)
+        if len(path) > 1:
+            start = path[0]  # The ghost moves on between repairs
+    assert flips > 0
+
+def test_path_cache_reuses_and_invalidates_paths():
+    cache = PathCache()
+    path = [(2, 1), (3, 1), (3, 2), (3, 3)]
+    cache.put((1, 1), (3, 3), path, epoch=0)
+    
+    # Complete paths survive unrelated flips; cells on them share the tail
+    assert cache.get((1, 1), (3, 3), epoch=4) == path
+    assert cache.get((3, 1), (3, 3), epoch=4) == [(3, 2), (3, 3)]
+    assert cache.get((3, 1), (5, 5), epoch=4) is None
+    
+    cache.invalidate_cells([(9, 9)])
+    assert cache.get((1, 1), (3, 3), epoch=4) == path
+    cache.invalidate_cells([(3, 2)])
+    assert cache.get((1, 1), (3, 3), epoch=4) is None
+    assert not cache.entries and not cache.cell_entries
+    assert cache.invalidations == 1
+
+def test_path_cache_trusts_partial_paths_only_in_their_epoch():
+    cache = PathCache()
+    cache.put((1, 1), (7, 7), [(2, 1), (3, 1)], epoch=2)
+    assert cache.get((1, 1), (7, 7), epoch=2) == [(2, 1), (3, 1)]
+    assert cache.get((1, 1), (7, 7), epoch=3) is None
+    assert not cache.entries
+
+def test_path_cache_evicts_least_recently_used():
+    cache = PathCache(max_entries=2)
+    for x in range(3):
+        cache.put((x, 0), (9, 9), [(x, 1), (9, 9)], epoch=0)
+    assert list(cache.entries) == [((1, 0), (9, 9)), ((2, 0), (9, 9))]
+    assert (0, 1) not in cache.cell_entries
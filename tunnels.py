@@ -1,8 +1,9 @@
 import pygame
 import math
 import random
+import numpy as np
 from typing import List, Tuple, Optional
-from maze import CellType
+from camera import to_screen, in_view
 
 class QuantumTunnel:
     def __init__(self, x: int, y: int, tunnel_id: int):
@@ -78,8 +79,10 @@ class QuantumTunnel:
             self.radius * 2
         )
     
-    def draw(self, screen):
+    def draw(self, screen, camera=None):
         """Draw the quantum tunnel with portal effects"""
+        screen_x, screen_y = to_screen(camera, self.x, self.y)
+        
         # Calculate dynamic effects
         pulse_size = 1 + math.sin(self.pulse_phase) * 0.3
         glow_intensity = (math.sin(self.pulse_phase * 1.5) + 1) * 0.5
@@ -109,7 +112,7 @@ class QuantumTunnel:
         
         screen.blit(
             field_surface,
-            (self.x - field_radius, self.y - field_radius),
+            (screen_x - field_radius, screen_y - field_radius),
             special_flags=pygame.BLEND_ADD
         )
         
@@ -118,7 +121,7 @@ class QuantumTunnel:
         ring_thickness = 3
         
         # Main portal ring
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), ring_radius, ring_thickness)
+        pygame.draw.circle(screen, self.color, (int(screen_x), int(screen_y)), ring_radius, ring_thickness)
         
         # Inner portal rings
         for i in range(3):
@@ -130,7 +133,7 @@ class QuantumTunnel:
                 # Create ring surface with alpha
                 ring_surf = pygame.Surface((inner_radius * 2, inner_radius * 2), pygame.SRCALPHA)
                 pygame.draw.circle(ring_surf, inner_color, (inner_radius, inner_radius), inner_radius, 2)
-                screen.blit(ring_surf, (self.x - inner_radius, self.y - inner_radius))
+                screen.blit(ring_surf, (screen_x - inner_radius, screen_y - inner_radius))
         
         # Draw portal vortex effect
         vortex_lines = 8
@@ -142,8 +145,8 @@ class QuantumTunnel:
                 spiral_radius = (j + 1) * 3
                 spiral_angle = angle + j * 0.5
                 
-                spiral_x = self.x + math.cos(spiral_angle) * spiral_radius
-                spiral_y = self.y + math.sin(spiral_angle) * spiral_radius
+                spiral_x = screen_x + math.cos(spiral_angle) * spiral_radius
+                spiral_y = screen_y + math.sin(spiral_angle) * spiral_radius
                 
                 particle_alpha = int(100 - j * 15)
                 if particle_alpha > 0:
@@ -159,10 +162,10 @@ class QuantumTunnel:
                 bolt_angle = (i / bolt_count) * math.pi * 2 + self.energy_phase
                 bolt_length = 20 + energy_flow * 5
                 
-                start_x = self.x + math.cos(bolt_angle) * (ring_radius - 5)
-                start_y = self.y + math.sin(bolt_angle) * (ring_radius - 5)
-                end_x = self.x + math.cos(bolt_angle) * bolt_length
-                end_y = self.y + math.sin(bolt_angle) * bolt_length
+                start_x = screen_x + math.cos(bolt_angle) * (ring_radius - 5)
+                start_y = screen_y + math.sin(bolt_angle) * (ring_radius - 5)
+                end_x = screen_x + math.cos(bolt_angle) * bolt_length
+                end_y = screen_y + math.sin(bolt_angle) * bolt_length
                 
                 # Draw jagged energy bolt
                 segments = 4
@@ -193,8 +196,8 @@ class QuantumTunnel:
             
             for i in range(arc_segments + 1):
                 angle = (i / arc_segments) * arc_angle - math.pi / 2
-                arc_x = self.x + math.cos(angle) * cooldown_radius
-                arc_y = self.y + math.sin(angle) * cooldown_radius
+                arc_x = screen_x + math.cos(angle) * cooldown_radius
+                arc_y = screen_y + math.sin(angle) * cooldown_radius
                 arc_points.append((int(arc_x), int(arc_y)))
             
             if len(arc_points) > 1:
@@ -203,37 +206,25 @@ class QuantumTunnel:
         # Draw tunnel ID indicator
         font = pygame.font.Font(None, 24)
         id_text = font.render(str(self.tunnel_id + 1), True, self.color)
-        text_rect = id_text.get_rect(center=(int(self.x), int(self.y - self.radius - 15)))
+        text_rect = id_text.get_rect(center=(int(screen_x), int(screen_y - self.radius - 15)))
         screen.blit(id_text, text_rect)
 
 class TunnelManager:
     def __init__(self):
         self.tunnels: List[QuantumTunnel] = []
         
-    def create_tunnel_pair(self, maze, tunnel_id: int = 0) -> bool:
-        """Create a pair of linked tunnels in the maze"""
-        # Find suitable positions for tunnels (far apart)
-        path_positions = []
-        for y in range(maze.height):
-            for x in range(maze.width):
-                if maze.grid[y][x] == CellType.PATH:
-                    center_x = x * maze.cell_size + maze.cell_size // 2
-                    center_y = y * maze.cell_size + maze.cell_size // 2
-                    path_positions.append((center_x, center_y))
-        
-        if len(path_positions) < 2:
-            return False
+    @staticmethod
+    def plan_tunnel_pair(maze) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
+        """Pick the positions of a tunnel pair, as far apart as possible"""
+        if maze.get_path_cell_count() < 2:
+            return None
+        return TunnelManager._find_farthest_pair(maze)
         
+    def create_tunnel_pair(self, maze, tunnel_id: int = 0,
+                           positions: Optional[Tuple[Tuple[int, int], Tuple[int, int]]] = None) -> bool:
+        """Create a pair of linked tunnels in the maze (at pre-planned positions if given)"""
         # Find two positions that are far apart
-        max_distance = 0
-        best_positions = None
-        
-        for i, pos1 in enumerate(path_positions):
-            for j, pos2 in enumerate(path_positions[i+1:], i+1):
-                distance = math.sqrt((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)
-                if distance > max_distance:
-                    max_distance = distance
-                    best_positions = (pos1, pos2)
+        best_positions = positions if positions is not None else self.plan_tunnel_pair(maze)
         
         if best_positions:
             pos1, pos2 = best_positions
@@ -251,6 +242,28 @@ class TunnelManager:
         
         return False
     
+    @staticmethod
+    def _find_farthest_pair(maze) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
+        """Find the two path cells furthest apart (in pixels)"""
+        xs, ys = maze.path_xs, maze.path_ys
+        
+        # The farthest pair lies on the convex hull, and only the leftmost and
+        # rightmost path cell of each row can be on it (the index is row-major)
+        _, row_starts = np.unique(ys, return_index=True)
+        row_ends = np.append(row_starts[1:], len(ys)) - 1
+        candidates = np.unique(np.concatenate((row_starts, row_ends)))
+        points = sorted(set(zip(xs[candidates].tolist(), ys[candidates].tolist())))
+        
+        hull = _convex_hull(points)
+        if len(hull) < 2:
+            return None
+        
+        hull_points = np.array(hull, dtype=np.int64)
+        deltas = hull_points[:, None, :] - hull_points[None, :, :]
+        distances = (deltas ** 2).sum(axis=2)
+        i, j = np.unravel_index(np.argmax(distances), distances.shape)
+        return (maze.cell_center(*hull[i]), maze.cell_center(*hull[j]))
+    
     def update(self, dt: float):
         """Update all tunnels"""
         for tunnel in self.tunnels:
@@ -264,10 +277,11 @@ class TunnelManager:
                     return True
         return False
     
-    def draw(self, screen):
-        """Draw all tunnels"""
+    def draw(self, screen, camera=None):
+        """Draw all tunnels in view"""
         for tunnel in self.tunnels:
-            tunnel.draw(screen)
+            if in_view(camera, tunnel.x, tunnel.y, 60):
+                tunnel.draw(screen, camera)
     
     def clear(self):
         """Clear all tunnels"""
@@ -276,3 +290,25 @@ class TunnelManager:
     def get_tunnel_count(self) -> int:
         """Get number of tunnel pairs"""
         return len(self.tunnels) // 2
+
+def _convex_hull(points: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Convex hull of sorted, distinct points (Andrew's monotone chain)"""
+    if len(points) <= 2:
+        return list(points)
+    
+    def cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+    
+    lower = []
+    for point in points:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], point) <= 0:
+            lower.pop()
+        lower.append(point)
+    
+    upper = []
+    for point in reversed(points):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], point) <= 0:
+            upper.pop()
+        upper.append(point)
+    
+    return lower[:-1] + upper[:-1]